@@ -40,10 +40,24 @@ class Settings(BaseSettings):
     sdxl_refiner_id: str = "stabilityai/stable-diffusion-xl-refiner-1.0"
     controlnet_model_id: str = "diffusers/controlnet-canny-sdxl-1.0"
     lora_weights_dir: str = "./models/lora"
+    sd_precision: str = "fp32"  # "fp32" or "bf16" (IPEX on CPU when installed)
+    sd_num_inference_steps: int = 3
+    sd_guidance_scale: float = 0.0  # <= 1 skips classifier-free guidance (one UNet pass per step)
+    enable_upscaler: bool = False  # x4 upscaler is heavy; off keeps the plain-resize fallback
+    upscaler_model_id: str = "stabilityai/stable-diffusion-x4-upscaler"
+    enable_torch_compile: bool = False  # first generation pays a multi-minute compile
+    deepcache_interval: int = 0  # reuse UNet features every N steps (needs more steps than N, no torch.compile); 0 disables DeepCache
     
     # Generation Configuration
     max_concurrent_jobs: int = 2
     job_timeout_seconds: int = 300
+    max_tracked_jobs: int = 1000  # job status entries kept in memory
+    job_retention_seconds: int = 3600  # how long finished jobs stay queryable
+    response_cache_ttl_seconds: int = 86400  # 0 disables the /generate response cache
+    enhance_batch_size: int = 4  # logos per upscaler call, lower if VRAM is tight
+    max_concurrent_enhancements: int = 4  # logos post-processed at once across all requests
+    sd_batch_window_ms: int = 50  # concurrent requests arriving within this window share one SD call
+    sd_max_batch_images: int = 8  # images per SD pipeline call across batched requests
     image_output_size: tuple = (1024, 1024)
     
     # WCAG Configuration
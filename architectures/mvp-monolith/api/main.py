@@ -4,13 +4,14 @@ Main FastAPI application entry point
 """
 
 from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 import logging
+import os
 from contextlib import asynccontextmanager
 
-from .config import Settings
+from .config import settings
+from .middleware import AllowAllCORSMiddleware
 from .routes import brand, health
 from .services.brand_service import BrandService
 
@@ -18,8 +19,6 @@ from .services.brand_service import BrandService
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-settings = Settings()
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
@@ -45,17 +44,12 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS (allow-all; configure appropriately for production)
+app.add_middleware(AllowAllCORSMiddleware)
 
 # Include routers
 app.include_router(health.router, prefix="/health", tags=["health"])
@@ -65,7 +59,7 @@ app.include_router(brand.router, prefix="/v1/brand", tags=["brand"])
 async def global_exception_handler(request, exc):
     """Global exception handler"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -80,10 +74,15 @@ async def root():
     }
 
 if __name__ == "__main__":
+    # Each worker loads its own copy of the models, so keep WORKERS low on
+    # memory-constrained hosts; reload is only for local development
     uvicorn.run(
         "api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1")),
+        reload=os.getenv("ENV") == "dev",
         log_level="info"
     )
@@ -0,0 +1,67 @@
+"""
+Lightweight ASGI middleware for the Brand Generator API
+"""
+
+# Headers are precomputed as raw ASGI tuples so each request only scans for
+# the Origin header and appends a fixed list
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_CORS_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+_PREFLIGHT_HEADERS = _CORS_HEADERS + [
+    (b"access-control-allow-methods", _ALLOW_METHODS),
+    (b"access-control-max-age", b"600"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+
+class AllowAllCORSMiddleware:
+    """
+    Allow-all CORS handled at the ASGI layer
+
+    Equivalent to CORSMiddleware with allow_origins/methods/headers set to
+    "*" and allow_credentials=True, without Starlette's per-request header
+    parsing. Requests without an Origin header pass through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Credentials are allowed, so the origin is echoed back instead of "*"
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(b"access-control-allow-origin", origin)] + _PREFLIGHT_HEADERS
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"access-control-allow-origin", origin)
+                ] + _CORS_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -1,4 +1,4 @@
-from .brand import BrandRequest, BrandResponse, LogoResult, BrandKit
+from .brand import BrandRequest, BrandResponse, LogoResult, BrandKit, BrandStatusResponse
 from .base import APIResponse
 
 __all__ = [
@@ -6,5 +6,6 @@ __all__ = [
     "BrandResponse", 
     "LogoResult",
     "BrandKit",
+    "BrandStatusResponse",
     "APIResponse"
 ]
@@ -2,33 +2,21 @@
 Base API models and schemas
 """
 
-from pydantic import BaseModel
-from typing import Any, Optional, Generic, TypeVar
+from pydantic import BaseModel, Field
+from typing import Any, Optional
 from datetime import datetime
 
-T = TypeVar('T')
-
-class APIResponse(BaseModel, Generic[T]):
-    """Generic API response wrapper"""
+class APIResponse(BaseModel):
+    """API response wrapper; subclasses narrow the type of data"""
     success: bool = True
-    data: Optional[T] = None
+    data: Any = None
     message: Optional[str] = None
     error: Optional[str] = None
-    timestamp: datetime = datetime.now()
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str = "healthy"
     version: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     services: dict[str, str] = {}
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
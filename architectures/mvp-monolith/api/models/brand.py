@@ -2,10 +2,16 @@
 Brand generation API models and schemas
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+import re
+
+from .base import APIResponse
+
+# #RRGGBB hex colors, as documented in the validation error
+_HEX_COLOR_RE = re.compile(r'^#[0-9a-fA-F]{6}$')
 
 class Industry(str, Enum):
     """Supported industries"""
@@ -56,14 +62,23 @@ class PersonalityTrait(str, Enum):
     TRUSTWORTHY = "trustworthy"
     INNOVATIVE = "innovative"
 
+# Wire-level types for BrandRequest, derived from the Enums above.
+# pydantic-core validates Literal strings with a set lookup, which is
+# cheaper than Enum validation.
+IndustryT = Literal[tuple(m.value for m in Industry)]
+LogoStyleT = Literal[tuple(m.value for m in LogoStyle)]
+ColorSchemeT = Literal[tuple(m.value for m in ColorScheme)]
+TargetAudienceT = Literal[tuple(m.value for m in TargetAudience)]
+PersonalityTraitT = Literal[tuple(m.value for m in PersonalityTrait)]
+
 class BrandRequest(BaseModel):
     """Request model for brand generation"""
     business_name: str = Field(..., min_length=1, max_length=100)
-    industry: Industry
-    style: LogoStyle
-    color_scheme: ColorScheme
-    personality_traits: List[PersonalityTrait] = Field(..., min_items=1, max_items=6)
-    target_audience: TargetAudience
+    industry: IndustryT
+    style: LogoStyleT
+    color_scheme: ColorSchemeT
+    personality_traits: List[PersonalityTraitT] = Field(..., min_length=1, max_length=6)
+    target_audience: TargetAudienceT
     prompt: str = Field(..., min_length=10, max_length=2000)
     negative_prompt: str = Field(..., min_length=5, max_length=1000)
     additional_notes: Optional[str] = Field(None, max_length=500)
@@ -72,20 +87,19 @@ class BrandRequest(BaseModel):
     num_logos: int = Field(default=3, ge=1, le=5)
     num_variations: int = Field(default=1, ge=1, le=3)
     
-    @validator('business_name')
+    @field_validator('business_name')
+    @classmethod
     def validate_business_name(cls, v):
         if not v.strip():
             raise ValueError('Business name cannot be empty')
         return v.strip()
     
-    @validator('prompt')
+    @field_validator('prompt')
+    @classmethod
     def validate_prompt(cls, v):
         if len(v.split()) < 3:
             raise ValueError('Prompt must contain at least 3 words')
         return v
-    
-    class Config:
-        use_enum_values = True
 
 class LogoResult(BaseModel):
     """Individual logo result"""
@@ -104,9 +118,10 @@ class ColorPalette(BaseModel):
     neutral: Optional[str] = None
     colors: List[str] = Field(default_factory=list)
     
-    @validator('primary', 'secondary', 'accent', 'neutral')
+    @field_validator('primary', 'secondary', 'accent', 'neutral')
+    @classmethod
     def validate_hex_color(cls, v):
-        if v and not (v.startswith('#') and len(v) == 7):
+        if v and not _HEX_COLOR_RE.match(v):
             raise ValueError('Color must be a valid hex color (e.g., #FF0000)')
         return v
 
@@ -148,11 +163,6 @@ class BrandResponse(BaseModel):
     social_media_exports: Optional[Dict[str, Any]] = None
     upscaling_applied: Optional[bool] = None
     enhancement_features: Optional[List[str]] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
 
 class BrandGenerationStatus(BaseModel):
     """Brand generation job status"""
@@ -162,8 +172,7 @@ class BrandGenerationStatus(BaseModel):
     current_step: Optional[str] = None
     estimated_completion: Optional[datetime] = None
     error_message: Optional[str] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+
+class BrandStatusResponse(APIResponse):
+    """API response wrapper for a job status"""
+    data: Optional[BrandGenerationStatus] = None
@@ -2,16 +2,19 @@
 Brand generation API routes
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, EmailStr
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
+import asyncio
 import logging
-from typing import Optional
+from datetime import datetime
+import orjson
+from typing import Annotated, Any, Callable, List, Optional
 
-from ..models.brand import BrandRequest, BrandResponse, BrandGenerationStatus
+from ..models.brand import BrandRequest, BrandResponse, BrandGenerationStatus, BrandStatusResponse
 from ..models.base import APIResponse
 from ..services.brand_service import BrandService
-from ..config import Settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -22,15 +25,42 @@ class EmailShareRequest(BaseModel):
     brand_data: dict
     message: Optional[str] = None
 
-def get_brand_service(settings: Settings = Depends(lambda: Settings())) -> BrandService:
-    """Dependency to get brand service instance"""
-    # In a real application, you'd want to use dependency injection
-    # For now, we'll create a new instance each time
-    return BrandService(settings)
+async def get_brand_service(request: Request) -> BrandService:
+    """Dependency to get the brand service created and initialized by the app lifespan"""
+    return request.app.state.brand_service
 
-@router.post("/generate", response_model=BrandResponse)
+# Upper bound on requests per batch call; throughput stops improving well
+# before this since all generations share the service's max_concurrent_jobs slots
+MAX_BATCH_SIZE = 32
+
+_BRAND_BATCH_ADAPTER = TypeAdapter(
+    Annotated[List[BrandRequest], Field(min_length=1, max_length=MAX_BATCH_SIZE)]
+)
+
+def _validate_body(validate_json: Callable[[bytes], Any], body: bytes) -> Any:
+    """Validate a raw JSON body, reporting errors like FastAPI's own parser"""
+    try:
+        return validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        )
+
+def _request_body_schema(schema: dict) -> dict:
+    """OpenAPI extra for routes that parse their JSON body by hand"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": schema}},
+            "required": True,
+        }
+    }
+
+_BRAND_REQUEST_BODY = _request_body_schema(BrandRequest.model_json_schema())
+_BRAND_BATCH_BODY = _request_body_schema(_BRAND_BATCH_ADAPTER.json_schema())
+
+@router.post("/generate", response_model=BrandResponse, openapi_extra=_BRAND_REQUEST_BODY)
 async def generate_brand(
-    request: BrandRequest,
+    http_request: Request,
     brand_service: BrandService = Depends(get_brand_service)
 ):
     """
@@ -42,6 +72,9 @@ async def generate_brand(
     - Typography suggestions
     - Brand description and guidelines
     """
+    # Validate the raw bytes in pydantic-core rather than json.loads + validate
+    request = _validate_body(BrandRequest.model_validate_json, await http_request.body())
+    
     try:
         logger.info(f"Received brand generation request for: {request.business_name}")
         
@@ -52,11 +85,15 @@ async def generate_brand(
         if not request.personality_traits:
             raise HTTPException(status_code=400, detail="At least one personality trait is required")
         
-        # Initialize service if needed
-        await brand_service.initialize()
+        # Serve identical requests from the on-disk response cache
+        cached = await brand_service.get_cached_response(request)
+        if cached is not None:
+            logger.info(f"Serving cached brand generation for {request.business_name}")
+            return Response(content=cached.model_dump_json(), media_type="application/json")
         
         # Generate brand identity
         result = await brand_service.generate_brand(request)
+        await brand_service.cache_response(request, result)
         
         logger.info(f"Brand generation completed for {request.business_name} in {result.processing_time_seconds:.2f}s")
         
@@ -73,7 +110,89 @@ async def generate_brand(
             detail="Internal server error during brand generation"
         )
 
-@router.get("/status/{job_id}", response_model=APIResponse[BrandGenerationStatus])
+@router.post("/generate/async", response_model=BrandResponse, status_code=202, openapi_extra=_BRAND_REQUEST_BODY)
+async def generate_brand_async(
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    brand_service: BrandService = Depends(get_brand_service)
+):
+    """
+    Queue a brand generation and return immediately
+    
+    Responds with 202 and a job_id while generation runs in the background.
+    Follow progress on /status/{job_id}/stream (or poll /status/{job_id}) and
+    fetch the finished brand kit from /result/{job_id}. Cached generations are returned directly with 200.
+    """
+    request = _validate_body(BrandRequest.model_validate_json, await http_request.body())
+    
+    cached = await brand_service.get_cached_response(request)
+    if cached is not None:
+        logger.info(f"Serving cached brand generation for {request.business_name}")
+        return Response(content=cached.model_dump_json(), media_type="application/json")
+    
+    job_id = brand_service.create_job(request)
+    background_tasks.add_task(brand_service.run_job, job_id, request)
+    
+    logger.info(f"Queued brand generation for {request.business_name} (job: {job_id})")
+    
+    return BrandResponse(
+        job_id=job_id,
+        business_name=request.business_name,
+        status="processing"
+    )
+
+@router.post("/generate/batch", response_model=List[BrandResponse], openapi_extra=_BRAND_BATCH_BODY)
+async def generate_brand_batch(
+    http_request: Request,
+    brand_service: BrandService = Depends(get_brand_service)
+):
+    """
+    Generate several brand identities in one call
+    
+    Accepts a list of up to 32 brand requests and runs them concurrently,
+    bounded by the configured max_concurrent_jobs. Cached brands are reused,
+    results are returned in request order, and the first failure cancels the
+    remaining generations.
+    """
+    requests = _validate_body(_BRAND_BATCH_ADAPTER.validate_json, await http_request.body())
+    
+    try:
+        logger.info(f"Received batch brand generation request for {len(requests)} brands")
+        
+        async def generate_one(request: BrandRequest) -> BrandResponse:
+            cached = await brand_service.get_cached_response(request)
+            if cached is not None:
+                return cached
+            
+            result = await brand_service.generate_brand(request)
+            await brand_service.cache_response(request, result)
+            return result
+        
+        tasks = [asyncio.create_task(generate_one(request)) for request in requests]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave the other generations running for a response that already failed
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        logger.info(f"Batch brand generation completed for {len(results)} brands")
+        
+        return results
+        
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    except Exception as e:
+        logger.error(f"Batch brand generation error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during batch brand generation"
+        )
+
+@router.get("/status/{job_id}", response_model=BrandStatusResponse)
 async def get_generation_status(
     job_id: str,
     brand_service: BrandService = Depends(get_brand_service)
@@ -89,7 +208,9 @@ async def get_generation_status(
         if not status:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        status_response = BrandGenerationStatus(
+        # The status dict is produced by BrandService itself, not by the
+        # client, so skip field validation and build the model directly
+        status_response = BrandGenerationStatus.model_construct(
             job_id=job_id,
             status=status.get("status", "unknown"),
             progress=status.get("progress", 0.0),
@@ -97,7 +218,7 @@ async def get_generation_status(
             error_message=status.get("error")
         )
         
-        return APIResponse(data=status_response)
+        return BrandStatusResponse(data=status_response)
         
     except HTTPException:
         raise
@@ -105,171 +226,220 @@ async def get_generation_status(
         logger.error(f"Error retrieving job status: {e}")
         raise HTTPException(status_code=500, detail="Error retrieving job status")
 
-@router.get("/styles", response_model=APIResponse[list])
-async def get_available_styles():
+@router.get("/status/{job_id}/stream")
+async def stream_generation_status(
+    job_id: str,
+    brand_service: BrandService = Depends(get_brand_service)
+):
+    """
+    Stream the status of a brand generation job as server-sent events
+    
+    Sends the current status immediately, then one event per progress update,
+    and closes once the job completes or fails.
+    """
+    if not await brand_service.get_job_status(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        async for event in brand_service.stream_job_status(job_id):
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@router.get("/result/{job_id}", response_model=BrandResponse)
+async def get_generation_result(
+    job_id: str,
+    brand_service: BrandService = Depends(get_brand_service)
+):
+    """
+    Get the finished brand kit of a job queued with /generate/async
+    
+    Returns 409 while the job is still pending or processing.
+    """
+    status = await brand_service.get_job_status(job_id)
+    
+    if not status:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if status.get("status") == "failed":
+        raise HTTPException(status_code=500, detail=f"Brand generation failed: {status.get('error')}")
+    
+    if "result_path" not in status:
+        raise HTTPException(status_code=409, detail=f"Job is {status.get('status', 'unknown')}")
+    
+    result = await brand_service.get_job_result(job_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Job result is no longer available")
+    
+    return result
+
+# Static listings served by the enum endpoints. These never change at runtime,
+# so they are wrapped in APIResponse and encoded to JSON once at import time.
+_STYLES = [
+    {
+        "id": "minimal",
+        "name": "Minimal",
+        "description": "Clean and simple with minimal elements"
+    },
+    {
+        "id": "geometric", 
+        "name": "Geometric",
+        "description": "Uses geometric shapes and mathematical precision"
+    },
+    {
+        "id": "text-based",
+        "name": "Text-based", 
+        "description": "Focus on typography and lettering design"
+    },
+    {
+        "id": "symbolic",
+        "name": "Symbolic",
+        "description": "Symbolic representation of brand concept"
+    },
+    {
+        "id": "abstract",
+        "name": "Abstract",
+        "description": "Abstract forms and creative interpretation"
+    },
+    {
+        "id": "classic",
+        "name": "Classic",
+        "description": "Timeless, traditional design principles"
+    }
+]
+
+_INDUSTRIES = [
+    {"id": "technology", "name": "Technology"},
+    {"id": "healthcare", "name": "Healthcare"},
+    {"id": "education", "name": "Education"},
+    {"id": "finance", "name": "Finance"},
+    {"id": "retail", "name": "Retail"},
+    {"id": "food", "name": "Food & Beverage"},
+    {"id": "fashion", "name": "Fashion"},
+    {"id": "automotive", "name": "Automotive"},
+    {"id": "real-estate", "name": "Real Estate"},
+    {"id": "consulting", "name": "Consulting"},
+    {"id": "creative", "name": "Creative Services"},
+    {"id": "other", "name": "Other"}
+]
+
+_PERSONALITY_TRAITS = [
+    {"id": "professional", "name": "Professional"},
+    {"id": "creative", "name": "Creative"},
+    {"id": "friendly", "name": "Friendly"},
+    {"id": "modern", "name": "Modern"},
+    {"id": "trustworthy", "name": "Trustworthy"},
+    {"id": "innovative", "name": "Innovative"}
+]
+
+_COLOR_SCHEMES = [
+    {
+        "id": "warm",
+        "name": "Warm tones",
+        "description": "Warm autumn colors like burnt orange, golden amber, and deep maroon",
+        "sample_colors": ["#D2691E", "#CC5500", "#FFB000"]
+    },
+    {
+        "id": "cool",
+        "name": "Cool tones", 
+        "description": "Cool colors like blues and teals",
+        "sample_colors": ["#4A90E2", "#357ABD", "#2E86C1"]
+    },
+    {
+        "id": "neutral",
+        "name": "Neutral tones",
+        "description": "Neutral colors like grays, whites, and earth tones", 
+        "sample_colors": ["#6B6B6B", "#8B8B8B", "#A0A0A0"]
+    },
+    {
+        "id": "vibrant",
+        "name": "Vibrant colors",
+        "description": "Vibrant and energetic colors",
+        "sample_colors": ["#FF6B6B", "#4ECDC4", "#45B7D1"]
+    }
+]
+
+_BRAND_EXAMPLES = [
+    {
+        "business_name": "TechFlow Solutions",
+        "industry": "technology",
+        "style": "minimal",
+        "color_scheme": "cool", 
+        "personality_traits": ["professional", "innovative"],
+        "target_audience": "businesses",
+        "description": "A clean, professional tech consulting brand with cool blue tones"
+    },
+    {
+        "business_name": "Bloom & Co",
+        "industry": "fashion",
+        "style": "creative",
+        "color_scheme": "warm",
+        "personality_traits": ["creative", "friendly"],
+        "target_audience": "young-adults", 
+        "description": "A creative fashion brand with warm, inviting colors"
+    },
+    {
+        "business_name": "Sterling Finance",
+        "industry": "finance",
+        "style": "classic",
+        "color_scheme": "neutral",
+        "personality_traits": ["trustworthy", "professional"],
+        "target_audience": "professionals",
+        "description": "A traditional, trustworthy financial services brand"
+    }
+]
+
+def _prerender(data: list) -> list:
+    """Validate a constant listing once into its JSON-ready form"""
+    return APIResponse(data=data).model_dump(mode="json")["data"]
+
+def _listing_response(data: list) -> Response:
+    """Wrap a pre-validated listing in an APIResponse body with a fresh timestamp"""
+    body = orjson.dumps({
+        "success": True,
+        "data": data,
+        "message": None,
+        "error": None,
+        "timestamp": datetime.now(),
+    })
+    return Response(content=body, media_type="application/json")
+
+_STYLES_PAYLOAD = _prerender(_STYLES)
+_INDUSTRIES_PAYLOAD = _prerender(_INDUSTRIES)
+_PERSONALITY_TRAITS_PAYLOAD = _prerender(_PERSONALITY_TRAITS)
+_COLOR_SCHEMES_PAYLOAD = _prerender(_COLOR_SCHEMES)
+_BRAND_EXAMPLES_PAYLOAD = _prerender(_BRAND_EXAMPLES)
+
+@router.get("/styles")
+async def get_available_styles() -> Response:
     """Get available logo styles"""
-    try:
-        styles = [
-            {
-                "id": "minimal",
-                "name": "Minimal",
-                "description": "Clean and simple with minimal elements"
-            },
-            {
-                "id": "geometric", 
-                "name": "Geometric",
-                "description": "Uses geometric shapes and mathematical precision"
-            },
-            {
-                "id": "text-based",
-                "name": "Text-based", 
-                "description": "Focus on typography and lettering design"
-            },
-            {
-                "id": "symbolic",
-                "name": "Symbolic",
-                "description": "Symbolic representation of brand concept"
-            },
-            {
-                "id": "abstract",
-                "name": "Abstract",
-                "description": "Abstract forms and creative interpretation"
-            },
-            {
-                "id": "classic",
-                "name": "Classic",
-                "description": "Timeless, traditional design principles"
-            }
-        ]
-        
-        return APIResponse(data=styles)
-        
-    except Exception as e:
-        logger.error(f"Error retrieving styles: {e}")
-        raise HTTPException(status_code=500, detail="Error retrieving available styles")
+    return _listing_response(_STYLES_PAYLOAD)
 
-@router.get("/industries", response_model=APIResponse[list])
-async def get_available_industries():
+@router.get("/industries")
+async def get_available_industries() -> Response:
     """Get available industries"""
-    try:
-        industries = [
-            {"id": "technology", "name": "Technology"},
-            {"id": "healthcare", "name": "Healthcare"},
-            {"id": "education", "name": "Education"},
-            {"id": "finance", "name": "Finance"},
-            {"id": "retail", "name": "Retail"},
-            {"id": "food", "name": "Food & Beverage"},
-            {"id": "fashion", "name": "Fashion"},
-            {"id": "automotive", "name": "Automotive"},
-            {"id": "real-estate", "name": "Real Estate"},
-            {"id": "consulting", "name": "Consulting"},
-            {"id": "creative", "name": "Creative Services"},
-            {"id": "other", "name": "Other"}
-        ]
-        
-        return APIResponse(data=industries)
-        
-    except Exception as e:
-        logger.error(f"Error retrieving industries: {e}")
-        raise HTTPException(status_code=500, detail="Error retrieving available industries")
+    return _listing_response(_INDUSTRIES_PAYLOAD)
 
-@router.get("/personalities", response_model=APIResponse[list])
-async def get_personality_traits():
+@router.get("/personalities")
+async def get_personality_traits() -> Response:
     """Get available personality traits"""
-    try:
-        traits = [
-            {"id": "professional", "name": "Professional"},
-            {"id": "creative", "name": "Creative"},
-            {"id": "friendly", "name": "Friendly"},
-            {"id": "modern", "name": "Modern"},
-            {"id": "trustworthy", "name": "Trustworthy"},
-            {"id": "innovative", "name": "Innovative"}
-        ]
-        
-        return APIResponse(data=traits)
-        
-    except Exception as e:
-        logger.error(f"Error retrieving personality traits: {e}")
-        raise HTTPException(status_code=500, detail="Error retrieving personality traits")
+    return _listing_response(_PERSONALITY_TRAITS_PAYLOAD)
 
-@router.get("/color-schemes", response_model=APIResponse[list])
-async def get_color_schemes():
+@router.get("/color-schemes")
+async def get_color_schemes() -> Response:
     """Get available color schemes"""
-    try:
-        schemes = [
-            {
-                "id": "warm",
-                "name": "Warm tones",
-                "description": "Warm autumn colors like burnt orange, golden amber, and deep maroon",
-                "sample_colors": ["#D2691E", "#CC5500", "#FFB000"]
-            },
-            {
-                "id": "cool",
-                "name": "Cool tones", 
-                "description": "Cool colors like blues and teals",
-                "sample_colors": ["#4A90E2", "#357ABD", "#2E86C1"]
-            },
-            {
-                "id": "neutral",
-                "name": "Neutral tones",
-                "description": "Neutral colors like grays, whites, and earth tones", 
-                "sample_colors": ["#6B6B6B", "#8B8B8B", "#A0A0A0"]
-            },
-            {
-                "id": "vibrant",
-                "name": "Vibrant colors",
-                "description": "Vibrant and energetic colors",
-                "sample_colors": ["#FF6B6B", "#4ECDC4", "#45B7D1"]
-            }
-        ]
-        
-        return APIResponse(data=schemes)
-        
-    except Exception as e:
-        logger.error(f"Error retrieving color schemes: {e}")
-        raise HTTPException(status_code=500, detail="Error retrieving color schemes")
+    return _listing_response(_COLOR_SCHEMES_PAYLOAD)
 
-@router.get("/examples", response_model=APIResponse[list])
-async def get_brand_examples():
+@router.get("/examples")
+async def get_brand_examples() -> Response:
     """Get example brand generations for inspiration"""
-    try:
-        examples = [
-            {
-                "business_name": "TechFlow Solutions",
-                "industry": "technology",
-                "style": "minimal",
-                "color_scheme": "cool", 
-                "personality_traits": ["professional", "innovative"],
-                "target_audience": "businesses",
-                "description": "A clean, professional tech consulting brand with cool blue tones"
-            },
-            {
-                "business_name": "Bloom & Co",
-                "industry": "fashion",
-                "style": "creative",
-                "color_scheme": "warm",
-                "personality_traits": ["creative", "friendly"],
-                "target_audience": "young-adults", 
-                "description": "A creative fashion brand with warm, inviting colors"
-            },
-            {
-                "business_name": "Sterling Finance",
-                "industry": "finance",
-                "style": "classic",
-                "color_scheme": "neutral",
-                "personality_traits": ["trustworthy", "professional"],
-                "target_audience": "professionals",
-                "description": "A traditional, trustworthy financial services brand"
-            }
-        ]
-        
-        return APIResponse(data=examples)
-        
-    except Exception as e:
-        logger.error(f"Error retrieving examples: {e}")
-        raise HTTPException(status_code=500, detail="Error retrieving brand examples")
+    return _listing_response(_BRAND_EXAMPLES_PAYLOAD)
 
-@router.post("/share/email", response_model=APIResponse[dict])
+@router.post("/share/email", response_model=APIResponse)
 async def share_brand_via_email(
     request: EmailShareRequest,
     background_tasks: BackgroundTasks,
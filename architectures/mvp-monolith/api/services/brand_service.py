@@ -3,24 +3,26 @@ Brand generation service with AI model integration
 """
 
 import asyncio
+import contextlib
 import uuid
 import logging
 import time
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple, get_args
 from PIL import Image, ImageFilter
 import io
 import base64
+import hashlib
 import os
+import zlib
 
-import tempfile
 import webcolors
 
 try:
     from diffusers import StableDiffusionPipeline, StableDiffusionUpscalePipeline
     import torch
     import numpy as np
-    from skimage import color, filters
-    from colorthief import ColorThief
     DIFFUSERS_AVAILABLE = True
 except ImportError:
     DIFFUSERS_AVAILABLE = False
@@ -28,35 +30,319 @@ except ImportError:
 
 from ..models.brand import (
     BrandRequest, BrandResponse, LogoResult, 
-    ColorPalette, Typography, BrandKit
+    ColorPalette, Typography, BrandKit,
+    IndustryT, LogoStyleT, PersonalityTraitT
 )
 from ..config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Placeholder logo colors per color scheme
+_PLACEHOLDER_COLOR_MAP = {
+    "warm": ["#D2691E", "#CC5500", "#FFB000"],
+    "cool": ["#4A90E2", "#357ABD", "#2E86C1"],
+    "neutral": ["#6B6B6B", "#8B8B8B", "#A0A0A0"],
+    "vibrant": ["#FF6B6B", "#4ECDC4", "#45B7D1"]
+}
+_DEFAULT_PLACEHOLDER_COLORS = ["#333333", "#666666", "#999999"]
+
+# Brand palettes per color scheme
+_PALETTE_MAP = {
+    "warm": {
+        "primary": "#D2691E",
+        "secondary": "#CC5500", 
+        "accent": "#FFB000",
+        "neutral": "#8B4513"
+    },
+    "cool": {
+        "primary": "#4A90E2",
+        "secondary": "#357ABD",
+        "accent": "#2E86C1", 
+        "neutral": "#708090"
+    },
+    "neutral": {
+        "primary": "#6B6B6B",
+        "secondary": "#8B8B8B",
+        "accent": "#A0A0A0",
+        "neutral": "#D3D3D3"
+    },
+    "vibrant": {
+        "primary": "#FF6B6B",
+        "secondary": "#4ECDC4", 
+        "accent": "#45B7D1",
+        "neutral": "#95A5A6"
+    }
+}
+
+# Validated once at import; the service only reads these, never mutates them
+_PALETTE_CACHE = {
+    scheme: ColorPalette(
+        primary=colors["primary"],
+        secondary=colors["secondary"],
+        accent=colors["accent"],
+        neutral=colors["neutral"],
+        colors=[colors["primary"], colors["secondary"], colors["accent"], colors["neutral"]]
+    )
+    for scheme, colors in _PALETTE_MAP.items()
+}
+
+_DEFAULT_PALETTE = ColorPalette(
+    primary="#333333",
+    secondary="#666666", 
+    accent="#999999",
+    neutral="#CCCCCC",
+    colors=["#333333", "#666666", "#999999", "#CCCCCC"]
+)
+
+# Font recommendations based on personality and industry
+_FONT_MAP = {
+    ("professional", "technology"): ("Inter", "Roboto"),
+    ("creative", "fashion"): ("Playfair Display", "Montserrat"),
+    ("friendly", "education"): ("Open Sans", "Lato"),
+    ("modern", "technology"): ("Poppins", "Source Sans Pro"),
+    ("trustworthy", "finance"): ("Georgia", "Times New Roman"),
+    ("innovative", "technology"): ("Helvetica Neue", "Arial"),
+}
+
+# Font recommendations based on personality only
+_PERSONALITY_FONTS = {
+    "professional": ("Inter", "Roboto"),
+    "creative": ("Playfair Display", "Montserrat"),
+    "friendly": ("Open Sans", "Lato"),
+    "modern": ("Poppins", "Source Sans Pro"),
+    "trustworthy": ("Georgia", "Times New Roman"),
+    "innovative": ("Helvetica Neue", "Arial")
+}
+
+_SANS_SERIF_FONTS = frozenset({"Inter", "Roboto", "Open Sans", "Lato", "Poppins", "Helvetica Neue", "Arial"})
+
+_DEFAULT_FONT_PAIR = ("Inter", "Roboto")
+
+def _build_typography(primary_font: str, secondary_font: str) -> Typography:
+    """Build the Typography recommendation for a font pair"""
+    return Typography(
+        primary_font=primary_font,
+        secondary_font=secondary_font,
+        font_family="sans-serif" if primary_font in _SANS_SERIF_FONTS else "serif",
+        font_style="regular",
+        weight="400"
+    )
+
+# Every valid (trait, industry) pair resolved once; like _PALETTE_CACHE these are shared and read-only
+_TYPOGRAPHY_CACHE = {
+    (trait, industry): _build_typography(
+        *(_FONT_MAP.get((trait, industry)) or _PERSONALITY_FONTS.get(trait, _DEFAULT_FONT_PAIR))
+    )
+    for trait in get_args(PersonalityTraitT)
+    for industry in get_args(IndustryT)
+}
+
+# Placeholder brand description, filled per request with str.format
+_BRAND_DESCRIPTION_TEMPLATE = (
+    "{business_name} is a {personality_text} {industry} company that serves {audience}. \n"
+    "\n"
+    "The brand embodies a {style} aesthetic with {color_scheme} tones, reflecting the company's "
+    "commitment to innovation and excellence in the {industry} sector.\n"
+    "\n"
+    "{business_name} stands out through its unique approach to combining traditional values with "
+    "modern solutions, creating a trustworthy yet forward-thinking brand identity that resonates "
+    "with its target market."
+)
+
+def _describe_brand(business_name: str, personality_traits: List[str], industry: str, audience: str,
+                    style: str, color_scheme: str, additional_notes: Optional[str]) -> str:
+    """Fill the description template"""
+    description = _BRAND_DESCRIPTION_TEMPLATE.format(
+        business_name=business_name,
+        personality_text=", ".join(personality_traits),
+        industry=industry,
+        audience=audience,
+        style=style,
+        color_scheme=color_scheme
+    )
+    
+    if additional_notes:
+        description = f"{description}\n\nAdditional considerations: {additional_notes}"
+    
+    return description
+
+# CSS3 named colors as an (N, 3) array for nearest-color lookups
+_CSS3_COLOR_RGB = np.array([tuple(webcolors.name_to_rgb(name)) for name in webcolors.names("css3")], dtype=np.int32)
+# rgb_to_name picks one canonical name for aliases such as gray/grey
+_CSS3_COLOR_NAMES = [webcolors.rgb_to_name(tuple(rgb)) for rgb in _CSS3_COLOR_RGB.tolist()]
+
+# Returned when color extraction fails
+_DEFAULT_EXTRACTED_COLORS = [
+    {'hex': '#333333', 'rgb': 'rgb(51, 51, 51)', 'name': 'Dark Gray', 'rgb_values': (51, 51, 51)},
+    {'hex': '#666666', 'rgb': 'rgb(102, 102, 102)', 'name': 'Gray', 'rgb_values': (102, 102, 102)},
+    {'hex': '#999999', 'rgb': 'rgb(153, 153, 153)', 'name': 'Light Gray', 'rgb_values': (153, 153, 153)},
+    {'hex': '#CCCCCC', 'rgb': 'rgb(204, 204, 204)', 'name': 'Silver', 'rgb_values': (204, 204, 204)},
+    {'hex': '#FF6B6B', 'rgb': 'rgb(255, 107, 107)', 'name': 'Light Coral', 'rgb_values': (255, 107, 107)},
+    {'hex': '#4ECDC4', 'rgb': 'rgb(78, 205, 196)', 'name': 'Medium Turquoise', 'rgb_values': (78, 205, 196)}
+]
+
+# Stable Diffusion prompt style modifiers
+_SD_STYLE_MODIFIERS = {
+    "minimal": "clean minimalist design, simple geometric shapes, flat design",
+    "geometric": "geometric shapes, mathematical precision, modern clean lines",
+    "text-based": "typography focused, lettering design, font-based logo",
+    "symbolic": "symbolic representation, meaningful icons, brand symbols",
+    "abstract": "abstract forms, creative interpretation, artistic shapes",
+    "classic": "timeless design, traditional elements, elegant composition"
+}
+
+# Industry-specific prompt elements
+_SD_INDUSTRY_ELEMENTS = {
+    "technology": "subtle tech elements, digital symbols, innovation themes",
+    "healthcare": "medical symbols, care icons, trust elements",
+    "education": "knowledge symbols, learning icons, growth elements",
+    "finance": "stability symbols, trust icons, prosperity elements",
+    "retail": "commerce symbols, shopping icons, consumer appeal",
+    "food": "organic shapes, appetite appeal, freshness symbols",
+    "fashion": "elegant design, style elements, luxury appeal",
+    "automotive": "motion symbols, power elements, reliability icons",
+    "real-estate": "stability symbols, home icons, growth elements",
+    "consulting": "expertise symbols, guidance icons, professional elements",
+    "creative": "artistic elements, creative symbols, imagination icons"
+}
+
+# Quality enhancers, followed per request by the personality term
+_SD_QUALITY_TERMS = ", ".join([
+    "high quality vector style",
+    "clean white background", 
+    "professional branding",
+    "scalable design",
+    "corporate identity"
+])
+
+def _sd_prompt_suffix(style: str, industry: str) -> str:
+    """Style, industry and quality part of the SD prompt"""
+    style_desc = _SD_STYLE_MODIFIERS.get(style, "minimalist design")
+    industry_desc = _SD_INDUSTRY_ELEMENTS.get(industry, "professional symbols")
+    return f"{style_desc}, {industry_desc}, {_SD_QUALITY_TERMS}"
+
+# Prompt suffixes for every valid (style, industry) pair, joined once at import
+_SD_PROMPT_SUFFIXES = {
+    (style, industry): _sd_prompt_suffix(style, industry)
+    for style in get_args(LogoStyleT)
+    for industry in get_args(IndustryT)
+}
+
+_SD_BASE_NEGATIVE_ELEMENTS = [
+    "blurry", "pixelated", "low quality", "text artifacts",
+    "complex details", "realistic photo", "3d render",
+    "multiple logos", "watermark", "signature", "cluttered",
+    "amateur", "unprofessional", "distorted", "ugly"
+]
+_SD_BASE_NEGATIVE_PROMPT = ", ".join(_SD_BASE_NEGATIVE_ELEMENTS)
+
+# Industry-specific negatives
+_SD_INDUSTRY_NEGATIVES = {
+    "technology": "circuit boards, gears, lightbulbs, atoms",
+    "healthcare": "red crosses, stethoscopes, pills, syringes",
+    "education": "graduation caps, apples, books, pencils",
+    "finance": "dollar signs, coins, piggy banks, graphs",
+    "retail": "shopping carts, price tags, bags",
+    "food": "chef hats, forks and knives, plates",
+    "fashion": "hangers, mannequins, sewing machines",
+    "automotive": "car silhouettes, wheels, keys",
+    "real-estate": "house shapes, keys, rooftops",
+    "consulting": "handshakes, briefcases, ties",
+    "creative": "paint brushes, palettes, easels"
+}
+
+_SD_NEGATIVE_PROMPTS = {
+    industry: f"{_SD_BASE_NEGATIVE_PROMPT}, {negatives}"
+    for industry, negatives in _SD_INDUSTRY_NEGATIVES.items()
+}
+
+# Logo color variations: hue shifts (fraction of the color wheel) and saturation
+# multipliers, limited to 6 so the user isn't overwhelmed
+_COLOR_VARIATION_HUE_SHIFTS = [0.0, 0.15, 0.3, 0.45, 0.6, 0.75]
+_COLOR_VARIATION_SATURATION_MULTS = [0.7, 0.85, 1.0, 1.15, 1.3, 1.5]
+
+# uint8 lookup tables per variation: hue wraps around, saturation is clipped
+_COLOR_VARIATION_LUTS = [
+    (
+        [(x + round(hue_shift * 256)) & 0xFF for x in range(256)],
+        [min(255, round(x * sat_mult)) for x in range(256)]
+    )
+    for hue_shift, sat_mult in zip(_COLOR_VARIATION_HUE_SHIFTS, _COLOR_VARIATION_SATURATION_MULTS)
+]
+
+# Distinct prompt pairs whose text embeddings are kept (about 0.5 MB each with CFG)
+_PROMPT_EMBEDS_CACHE_SIZE = 64
+
+# Bounding box for LogoResult.thumbnail_url images
+_THUMBNAIL_SIZE = (128, 128)
+
+# Returned when a placeholder PNG cannot be rendered
+_FALLBACK_LOGO_DATA_URL = "data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNTEyIiBoZWlnaHQ9IjUxMiIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cmVjdCB3aWR0aD0iMTAwJSIgaGVpZ2h0PSIxMDAlIiBmaWxsPSIjY2NjIi8+PHRleHQgeD0iNTAlIiB5PSI1MCUiIGZvbnQtZmFtaWx5PSJBcmlhbCwgc2Fucy1zZXJpZiIgZm9udC1zaXplPSIxOCIgZmlsbD0iIzMzMyIgdGV4dC1hbmNob3I9Im1pZGRsZSIgZHk9Ii4zZW0iPkxvZ28gUGxhY2Vob2xkZXI8L3RleHQ+PC9zdmc+"
+
+def _png_data_url(png_bytes) -> str:
+    """Build a PNG data URL from encoded bytes or a BytesIO buffer view, decoding the base64 once"""
+    return (b"data:image/png;base64," + base64.b64encode(png_bytes)).decode('ascii')
+
+# Seconds between sweeps of expired files out of the response cache
+_RESPONSE_CACHE_PRUNE_INTERVAL = 3600
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write an already-encoded file"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
 class BrandService:
     """Service for generating complete brand identities using AI models"""
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.active_jobs: Dict[str, Dict] = {}
+        self.active_jobs: OrderedDict[str, Dict] = OrderedDict()
+        # One queue per open status stream, keyed by job id
+        self._job_watchers: Dict[str, List[asyncio.Queue]] = {}
+        self._initialized = False
+        self._ai_models_loaded = False
+        self._ai_models_lock = asyncio.Lock()
+        # Generations running at once across /generate, /generate/async and batch calls
+        self._job_semaphore = asyncio.Semaphore(settings.max_concurrent_jobs)
+        # Serializes upscaler calls across concurrent requests
+        self._upscaler_lock = asyncio.Lock()
+        # Backpressure for per-logo enhancement, which holds full-size images in memory
+        self._enhance_semaphore = asyncio.Semaphore(settings.max_concurrent_enhancements)
+        # Requests waiting for a shared SD pipeline call, and the task draining them
+        self._sd_pending: List[tuple] = []
+        self._sd_batch_task: Optional[asyncio.Task] = None
+        
+        # Placeholder data URLs keyed by color, filled during initialize()
+        self._placeholder_cache: Dict[str, str] = {}
+        
+        # Text-encoder outputs keyed by (prompt, negative_prompt), most recent last
+        self._prompt_embeds_cache: OrderedDict = OrderedDict()
         
         # Model components (to be initialized)
         self.sd_pipeline = None
         self.upscaler_pipeline = None
         self.controlnet = None
+        self.deepcache_helper = None
         self.neo4j_driver = None
-        # Force CPU for stability (you can change to cuda if you have GPU)
-        self.device = "cpu" if DIFFUSERS_AVAILABLE else "cpu"
+        self.device = "cuda" if DIFFUSERS_AVAILABLE and torch.cuda.is_available() else "cpu"
         
         # Create storage directories
         self.storage_dir = os.path.join(os.path.dirname(__file__), "../../storage")
         self.logos_dir = os.path.join(self.storage_dir, "logos")
         self.social_exports_dir = os.path.join(self.storage_dir, "social_exports")
         self.variations_dir = os.path.join(self.storage_dir, "variations")
+        self.response_cache_dir = os.path.join(self.storage_dir, "response_cache")
+        self._response_cache_pruned_at = 0.0
+        # Finished /generate/async responses, referenced from active_jobs by path
+        self.job_results_dir = os.path.join(self.storage_dir, "job_results")
         os.makedirs(self.logos_dir, exist_ok=True)
         os.makedirs(self.social_exports_dir, exist_ok=True)
         os.makedirs(self.variations_dir, exist_ok=True)
+        os.makedirs(self.response_cache_dir, exist_ok=True)
+        os.makedirs(self.job_results_dir, exist_ok=True)
+        
+        # Shared by all requests for rendering social media exports
+        self._export_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="social-export")
         
         # Social media dimensions
         self.social_media_formats = {
@@ -70,23 +356,46 @@ class BrandService:
         }
         
     async def initialize(self):
-        """Initialize AI models and external services"""
+        """Initialize external services; AI models load on the first generation"""
+        if self._initialized:
+            return
+        
         logger.info("Initializing Brand Service...")
         
         try:
-            # Initialize AI models (placeholder - you'll integrate your actual models)
-            await self._initialize_ai_models()
-            
             # Initialize external services
             await self._initialize_external_services()
             
+            # Pre-render the solid-color placeholder logos
+            await self._initialize_placeholder_cache()
+            
+            # Results of jobs from a previous process can no longer be looked up
+            await asyncio.to_thread(self._clear_job_results)
+            
+            # Drop responses that expired while the service was down
+            if self.settings.response_cache_ttl_seconds > 0:
+                self._response_cache_pruned_at = time.time()
+                await asyncio.to_thread(self._prune_response_cache)
+            
+            self._initialized = True
             logger.info("Brand Service initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize Brand Service: {e}")
             raise
     
-    async def _initialize_ai_models(self):
+    async def _ensure_ai_models(self):
+        """Load the AI models on first use so startup stays fast and idle instances stay small"""
+        if self._ai_models_loaded:
+            return
+        
+        async with self._ai_models_lock:
+            if not self._ai_models_loaded:
+                await asyncio.to_thread(self._load_ai_models)
+                # Also set after a failed load, so requests fall back instead of retrying the load
+                self._ai_models_loaded = True
+    
+    def _load_ai_models(self):
         """Initialize AI models for logo generation with CPU optimizations"""
         logger.info("Loading AI models...")
         
@@ -99,66 +408,144 @@ class BrandService:
             torch.set_num_threads(4)  # Use 4 CPU threads
             torch.manual_seed(42)     # Set seed for reproducible results
             
-            logger.info(f"Loading Stable Diffusion model on CPU with optimizations...")
+            use_bf16 = self.settings.sd_precision == "bf16"
+            
+            if self.device == "cuda":
+                dtype, variant = torch.float16, "fp16"
+            else:
+                dtype, variant = (torch.bfloat16 if use_bf16 else torch.float32), None
+            
+            logger.info(f"Loading Stable Diffusion model on {self.device} in {dtype}...")
             
             # Use ultra-lightweight model for AWS Free Tier
             logger.info("Loading CompVis/stable-diffusion-v1-4 with extreme optimizations for free tier...")
             self.sd_pipeline = StableDiffusionPipeline.from_pretrained(
                 "CompVis/stable-diffusion-v1-4",  # Smaller than v1.5
-                torch_dtype=torch.float32,
+                torch_dtype=dtype,
                 use_safetensors=True,
                 safety_checker=None,  # Disable for speed and memory
                 requires_safety_checker=False,
                 low_cpu_mem_usage=True,
-                variant=None,  # No fp16 variant to save memory
+                variant=variant,
                 cache_dir="/tmp/huggingface_cache"  # Use tmp for free tier
             )
             
-            # Move to CPU and apply aggressive optimizations
-            self.sd_pipeline = self.sd_pipeline.to("cpu")
+            # Keep the whole pipeline resident on the device; CPU offloading would
+            # move every module across the bus on each generation
+            self.sd_pipeline = self.sd_pipeline.to(self.device)
             
-            # Apply all available CPU optimizations
+            # Fused attention (xformers on CUDA, PyTorch SDPA otherwise) never
+            # materializes the full attention matrix; slicing is only the fallback
             try:
-                self.sd_pipeline.enable_attention_slicing("max")
-                logger.info("Enabled attention slicing for memory optimization")
+                self._enable_fused_attention(self.sd_pipeline)
             except Exception as opt_e:
-                logger.warning(f"Could not enable attention slicing: {opt_e}")
-            
-            try:
-                self.sd_pipeline.enable_model_cpu_offload()
-                logger.info("Enabled model CPU offloading")
-            except Exception as opt_e:
-                logger.warning(f"Could not enable CPU offloading: {opt_e}")
+                logger.warning(f"Could not enable fused attention: {opt_e}")
+                try:
+                    # "auto" halves the attention heads per slice; "max" ran one head at a time
+                    self.sd_pipeline.enable_attention_slicing("auto")
+                    logger.info("Enabled attention slicing for memory optimization")
+                except Exception as opt_e:
+                    logger.warning(f"Could not enable attention slicing: {opt_e}")
             
             # Set scheduler to use fewer steps for faster generation
             from diffusers import DPMSolverMultistepScheduler
             try:
+                # DPM-Solver++ 2M with Karras sigmas holds up at very low step counts
                 self.sd_pipeline.scheduler = DPMSolverMultistepScheduler.from_config(
-                    self.sd_pipeline.scheduler.config
+                    self.sd_pipeline.scheduler.config,
+                    algorithm_type="dpmsolver++",
+                    solver_order=2,
+                    use_karras_sigmas=True
                 )
-                logger.info("Using DPM Solver for faster generation")
+                logger.info("Using DPM Solver++ 2M Karras for faster generation")
             except Exception as sched_e:
                 logger.warning(f"Could not set DPM scheduler: {sched_e}")
             
-            # Skip upscaler for now to improve reliability
-            logger.info("Skipping upscaler initialization for better performance")
-            self.upscaler_pipeline = None
-            
-            # Warm up the pipeline with a test generation
-            logger.info("Warming up pipeline...")
+            # Slicing/tiling lower the VAE decode memory peak so larger batches fit
+            try:
+                self.sd_pipeline.enable_vae_slicing()
+                self.sd_pipeline.enable_vae_tiling()
+                logger.info("Enabled VAE slicing and tiling")
+            except Exception as opt_e:
+                logger.warning(f"Could not enable VAE slicing/tiling: {opt_e}")
+            
+            # With no more steps than the interval, only the first step runs the full
+            # UNet; DeepCache's hooks also haven't been validated under torch.compile
+            use_deepcache = self.settings.deepcache_interval > 0
+            if use_deepcache and self.settings.sd_num_inference_steps <= self.settings.deepcache_interval:
+                logger.warning("Skipping DeepCache: sd_num_inference_steps must exceed deepcache_interval")
+                use_deepcache = False
+            if use_deepcache and self.settings.enable_torch_compile:
+                logger.warning("Skipping DeepCache: not combined with torch.compile")
+                use_deepcache = False
+            
+            if use_deepcache:
+                try:
+                    from DeepCache import DeepCacheSDHelper
+                    self.deepcache_helper = DeepCacheSDHelper(pipe=self.sd_pipeline)
+                    self.deepcache_helper.set_params(
+                        cache_interval=self.settings.deepcache_interval,
+                        cache_branch_id=0
+                    )
+                    self.deepcache_helper.enable()
+                    logger.info(f"Enabled DeepCache (interval {self.settings.deepcache_interval})")
+                except ImportError:
+                    logger.warning("DeepCache not available. Install with: pip install DeepCache")
+                except Exception as opt_e:
+                    self.deepcache_helper = None
+                    logger.warning(f"Could not enable DeepCache: {opt_e}")
+            
+            # channels_last suits the UNet/VAE convolutions on both CPU and CUDA
             try:
-                with torch.no_grad():
-                    warmup_image = self.sd_pipeline(
-                        "test logo",
-                        num_inference_steps=5,
-                        guidance_scale=5.0,
-                        width=256,
-                        height=256,
-                        output_type="pil"
-                    ).images[0]
-                    logger.info("Pipeline warmup successful")
-            except Exception as warmup_e:
-                logger.warning(f"Pipeline warmup failed: {warmup_e}")
+                self.sd_pipeline.unet.to(memory_format=torch.channels_last)
+                self.sd_pipeline.vae.to(memory_format=torch.channels_last)
+                logger.info("Using channels_last memory format")
+            except Exception as opt_e:
+                logger.warning(f"Could not switch to channels_last: {opt_e}")
+            
+            if self.settings.sd_precision == "bf16" and self.device == "cpu":
+                try:
+                    # IPEX fuses bf16 UNet/VAE kernels for AMX/AVX-512 CPUs
+                    import intel_extension_for_pytorch as ipex
+                    self.sd_pipeline.unet = ipex.optimize(self.sd_pipeline.unet.eval(), dtype=torch.bfloat16, inplace=True)
+                    self.sd_pipeline.vae = ipex.optimize(self.sd_pipeline.vae.eval(), dtype=torch.bfloat16, inplace=True)
+                    logger.info("Optimized UNet and VAE with IPEX bf16")
+                except ImportError:
+                    logger.warning("IPEX not available, running bf16 without it. Install with: pip install intel-extension-for-pytorch")
+                except Exception as opt_e:
+                    logger.warning(f"Could not apply IPEX optimizations: {opt_e}")
+            
+            if self.settings.enable_torch_compile:
+                try:
+                    # Keep Inductor's compiled kernels next to the model weights instead of
+                    # /tmp, so a restart with the same model_cache_dir skips the recompile.
+                    # Inductor reads this when it first compiles, not at import
+                    os.environ.setdefault(
+                        "TORCHINDUCTOR_CACHE_DIR",
+                        os.path.join(os.path.abspath(self.settings.model_cache_dir), "torchinductor")
+                    )
+                    # Run 1x1 convs as matmuls, and fall back to eager for graphs Inductor can't handle
+                    torch._inductor.config.conv_1x1_as_mm = True
+                    torch._dynamo.config.suppress_errors = True
+                    
+                    # CUDA graphs ("reduce-overhead") are only available on GPU
+                    if self.device == "cuda":
+                        self.sd_pipeline.unet = torch.compile(
+                            self.sd_pipeline.unet, mode="reduce-overhead", fullgraph=True
+                        )
+                    else:
+                        self.sd_pipeline.unet = torch.compile(self.sd_pipeline.unet)
+                    self.sd_pipeline.vae.decode = torch.compile(self.sd_pipeline.vae.decode)
+                    logger.info("Compiled UNet and VAE decoder with torch.compile (compiles on the first generation)")
+                except Exception as opt_e:
+                    logger.warning(f"Could not compile UNet: {opt_e}")
+            
+            if self.settings.enable_upscaler:
+                self._load_upscaler(use_bf16)
+            else:
+                # Skip upscaler for now to improve reliability
+                logger.info("Skipping upscaler initialization for better performance")
+                self.upscaler_pipeline = None
             
             logger.info("AI models loaded and optimized successfully")
             
@@ -168,6 +555,54 @@ class BrandService:
             import traceback
             logger.error(f"Full error: {traceback.format_exc()}")
     
+    def _enable_fused_attention(self, pipeline):
+        """Use xformers attention on CUDA when installed, PyTorch SDPA otherwise"""
+        if self.device == "cuda":
+            try:
+                pipeline.enable_xformers_memory_efficient_attention()
+                logger.info("Enabled xformers memory efficient attention")
+                return
+            except Exception as opt_e:
+                logger.warning(f"Could not enable xformers attention, using SDPA: {opt_e}")
+        
+        from diffusers.models.attention_processor import AttnProcessor2_0
+        pipeline.unet.set_attn_processor(AttnProcessor2_0())
+        logger.info("Using PyTorch scaled_dot_product_attention")
+    
+    def _load_upscaler(self, use_bf16: bool):
+        """Load the x4 upscaler in half precision where the device supports it"""
+        try:
+            if self.device == "cuda":
+                dtype, variant = torch.float16, "fp16"
+            else:
+                dtype, variant = (torch.bfloat16 if use_bf16 else torch.float32), None
+            
+            self.upscaler_pipeline = StableDiffusionUpscalePipeline.from_pretrained(
+                self.settings.upscaler_model_id,
+                torch_dtype=dtype,
+                variant=variant,
+                low_cpu_mem_usage=True,
+                cache_dir="/tmp/huggingface_cache"
+            ).to(self.device)
+            
+            # Fused attention and VAE tiling cap the memory peak of 4x outputs. The
+            # upscale pipeline has no enable_vae_tiling(), so tile on the VAE itself
+            try:
+                self.upscaler_pipeline.vae.enable_tiling()
+            except Exception as opt_e:
+                logger.warning(f"Could not enable VAE tiling for upscaler: {opt_e}")
+            try:
+                self._enable_fused_attention(self.upscaler_pipeline)
+            except Exception as opt_e:
+                logger.warning(f"Could not enable fused attention for upscaler: {opt_e}")
+                self.upscaler_pipeline.enable_attention_slicing()
+            
+            logger.info(f"Loaded upscaler in {dtype}")
+            
+        except Exception as e:
+            logger.error(f"Failed to load upscaler: {e}")
+            self.upscaler_pipeline = None
+    
     async def _initialize_external_services(self):
         """Initialize Neo4j and other external services"""
         try:
@@ -184,72 +619,132 @@ class BrandService:
             logger.error(f"Failed to initialize external services: {e}")
             logger.warning("Continuing without external services for testing")
     
-    async def generate_brand(self, request: BrandRequest) -> BrandResponse:
+    async def _initialize_placeholder_cache(self):
+        """Render every placeholder color once so fallback logos are a dict lookup"""
+        colors = {color for colors in _PLACEHOLDER_COLOR_MAP.values() for color in colors}
+        colors.update(_DEFAULT_PLACEHOLDER_COLORS)
+        
+        for color in colors:
+            self._placeholder_cache[color] = await asyncio.to_thread(self._render_placeholder_png, color)
+        
+        logger.info(f"Cached {len(self._placeholder_cache)} placeholder logos")
+    
+    def create_job(self, request: BrandRequest) -> str:
+        """Register a queued brand generation job and return its id"""
+        job_id = str(uuid.uuid4())
+        self._track_job(job_id, {
+            "status": "pending",
+            "progress": 0.0,
+            "current_step": "Queued",
+            "business_name": request.business_name
+        })
+        return job_id
+    
+    async def run_job(self, job_id: str, request: BrandRequest):
+        """Run a queued job and keep its response for later retrieval"""
+        try:
+            response = await self.generate_brand(request, job_id=job_id)
+        except Exception:
+            # generate_brand has already recorded the failure for status polls
+            return
+        
+        await self.cache_response(request, response)
+        
+        # A response is several MB of base64 images, so the job table only keeps
+        # the path of a file holding it; /result reads it back on demand
+        result_path = self._job_result_path(job_id)
+        try:
+            await asyncio.to_thread(_write_bytes, result_path, response.model_dump_json().encode())
+        except OSError as e:
+            logger.error(f"Could not store result of job {job_id}: {e}")
+            self._track_job(job_id, {"status": "failed", "error": "Could not store the generated brand kit"})
+        else:
+            self._track_job(job_id, {
+                "status": "completed",
+                "progress": 1.0,
+                "current_step": "Completed",
+                "result_path": result_path
+            })
+        self._expire_job_later(job_id)
+    
+    async def generate_brand(self, request: BrandRequest, job_id: Optional[str] = None) -> BrandResponse:
+        """Generate a complete brand identity, at most max_concurrent_jobs at a time"""
+        async with self._job_semaphore:
+            return await self._generate_brand(request, job_id)
+    
+    async def _generate_brand(self, request: BrandRequest, job_id: Optional[str]) -> BrandResponse:
         """Generate a complete brand identity"""
         start_time = time.time()
-        job_id = str(uuid.uuid4())
+        job_id = job_id or str(uuid.uuid4())
         
         logger.info(f"Starting brand generation for {request.business_name} (job: {job_id})")
         
         try:
             # Store job status
-            self.active_jobs[job_id] = {
+            self._track_job(job_id, {
                 "status": "processing",
                 "progress": 0.0,
                 "current_step": "Initializing",
-                "request": request
-            }
+                "business_name": request.business_name
+            })
             
-            # Step 1: Generate logos using AI models
-            self._update_job_progress(job_id, 0.1, "Generating logo concepts...")
-            logos = await self._generate_logos(request)
+            # Steps 1-4: logos, color palette (KGS), typography and brand
+            # description are independent, so run them concurrently.
+            # Generated logos also leave their decoded images here for step 5
+            logo_images: Dict[str, Image.Image] = {}
+            self._update_job_progress(job_id, 0.1, "Generating logos, colors, typography and description...")
+            step_tasks = {
+                asyncio.create_task(self._generate_logos(request, logo_images)): "Logo concepts generated",
+                asyncio.create_task(self._generate_color_palette(request)): "Color palette created",
+                asyncio.create_task(self._generate_typography(request)): "Typography selected",
+                asyncio.create_task(self._generate_brand_description(request)): "Brand description created",
+            }
+            completed_steps = 0
             
-            # Step 2: Generate color palette using KGS
-            self._update_job_progress(job_id, 0.4, "Creating color palette...")
-            color_palette = await self._generate_color_palette(request)
+            def on_step_done(task: asyncio.Task):
+                # Progress only depends on how many steps finished, so it stays monotonic
+                nonlocal completed_steps
+                completed_steps += 1
+                self._update_job_progress(job_id, 0.1 + 0.7 * completed_steps / len(step_tasks), step_tasks[task])
             
-            # Step 3: Generate typography recommendations
-            self._update_job_progress(job_id, 0.6, "Selecting typography...")
-            typography = await self._generate_typography(request)
+            for task in step_tasks:
+                task.add_done_callback(on_step_done)
             
-            # Step 4: Generate brand description
-            self._update_job_progress(job_id, 0.8, "Creating brand description...")
-            brand_description = await self._generate_brand_description(request)
+            logos, color_palette, typography, brand_description = await asyncio.gather(*step_tasks)
             
             # Step 5: Apply upscaling if needed
             self._update_job_progress(job_id, 0.9, "Enhancing images...")
-            enhanced_logos = await self._enhance_logos(logos)
+            enhanced_logos = await self._enhance_logos(logos, logo_images)
             
             # Step 6: Finalize response
             self._update_job_progress(job_id, 1.0, "Finalizing brand kit...")
             
             processing_time = time.time() - start_time
             
-            # Collect enhancement data from logos
-            all_extracted_colors = []
+            # Collect enhancement data from logos in a single pass
+            extracted_colors_by_hex = {}
             social_exports_summary = {}
             enhancement_features = set()
+            color_variations_available = False
+            upscaling_applied = False
             
             for logo in enhanced_logos:
-                if 'extracted_colors' in logo.metadata:
-                    all_extracted_colors.extend(logo.metadata['extracted_colors'])
-                if 'social_exports' in logo.metadata:
-                    social_exports_summary[logo.id] = logo.metadata['social_exports']
-                if 'enhancement_features' in logo.metadata:
-                    enhancement_features.update(logo.metadata['enhancement_features'])
-            
-            # Remove duplicates from extracted colors (handle dict objects properly)
-            unique_extracted_colors = []
-            seen_colors = set()
-            for color_info in all_extracted_colors:
-                if isinstance(color_info, dict) and 'hex' in color_info:
-                    hex_color = color_info['hex']
-                    if hex_color not in seen_colors:
-                        seen_colors.add(hex_color)
-                        unique_extracted_colors.append(hex_color)  # Just use the hex string
-                elif isinstance(color_info, str) and color_info not in seen_colors:
-                    seen_colors.add(color_info)
-                    unique_extracted_colors.append(color_info)
+                metadata = logo.metadata
+                # Dict insertion de-duplicates by hex while keeping first-seen order
+                for color_info in metadata.get('extracted_colors', ()):
+                    if isinstance(color_info, dict):
+                        if 'hex' in color_info:
+                            extracted_colors_by_hex.setdefault(color_info['hex'], None)
+                    elif isinstance(color_info, str):
+                        extracted_colors_by_hex.setdefault(color_info, None)
+                if 'social_exports' in metadata:
+                    social_exports_summary[logo.id] = metadata['social_exports']
+                if 'enhancement_features' in metadata:
+                    enhancement_features.update(metadata['enhancement_features'])
+                color_variations_available = color_variations_available or 'color_variations' in metadata
+                upscaling_applied = upscaling_applied or bool(metadata.get('upscaled'))
+            
+            unique_extracted_colors = list(extracted_colors_by_hex)
             
             response = BrandResponse(
                 job_id=job_id,
@@ -263,9 +758,9 @@ class BrandService:
                 brand_description=brand_description,
                 # Enhanced features
                 extracted_colors=unique_extracted_colors[:12],  # Limit to 12 colors
-                color_variations_available=len(enhanced_logos) > 0 and any('color_variations' in logo.metadata for logo in enhanced_logos),
+                color_variations_available=color_variations_available,
                 social_media_exports=social_exports_summary,
-                upscaling_applied=any('upscaled' in logo.metadata for logo in enhanced_logos),
+                upscaling_applied=upscaling_applied,
                 enhancement_features=list(enhancement_features)
             )
             
@@ -275,15 +770,27 @@ class BrandService:
             logger.info(f"Brand generation completed in {processing_time:.2f}s")
             return response
             
+        except asyncio.CancelledError:
+            # e.g. a failed sibling in a batch call; nobody will poll this job,
+            # but open status streams still need a terminal event to end on
+            self._track_job(job_id, {
+                "status": "failed",
+                "error": "Job was cancelled"
+            })
+            self.active_jobs.pop(job_id, None)
+            raise
+        
         except Exception as e:
             logger.error(f"Brand generation failed: {e}")
-            self.active_jobs[job_id] = {
+            self._track_job(job_id, {
                 "status": "failed",
                 "error": str(e)
-            }
+            })
+            self._expire_job_later(job_id)
             raise
     
-    async def _generate_logos(self, request: BrandRequest) -> List[LogoResult]:
+    async def _generate_logos(self, request: BrandRequest,
+                              logo_images: Optional[Dict[str, Image.Image]] = None) -> List[LogoResult]:
         """Generate logos using Stable Diffusion with comprehensive error handling"""
         logger.info(f"Starting logo generation for {request.business_name}")
         logger.info(f"Parameters: style={request.style}, industry={request.industry}, color_scheme={request.color_scheme}")
@@ -291,6 +798,8 @@ class BrandService:
         try:
             logos = []
             
+            await self._ensure_ai_models()
+            
             # Use Stable Diffusion if available, otherwise fallback to placeholder
             if self.sd_pipeline:
                 logger.info("SD pipeline available, checking pipeline status...")
@@ -303,52 +812,37 @@ class BrandService:
                 
                 # Generate optimized prompt for logo creation
                 logo_prompt = self._build_sd_prompt(request)
-                negative_prompt = self._build_sd_negative_prompt(request)
+                # Without classifier-free guidance the negative prompt is never encoded
+                use_cfg = self.settings.sd_guidance_scale > 1.0
+                negative_prompt = self._build_sd_negative_prompt(request) if use_cfg else None
                 
                 logger.info(f"SD Prompt: {logo_prompt[:100]}...")
                 
                 # Generate images with Stable Diffusion (CPU optimized)
-                logger.info(f"Generating {request.num_logos} logos on CPU...")
+                logger.info(f"Generating {request.num_logos} logos on {self.device}...")
                 
-                # Use torch.no_grad() for better memory management
-                with torch.no_grad():
-                    # Generate logos one by one for better memory management
-                    images = []
-                    for i in range(request.num_logos):
-                        logger.info(f"Generating logo {i+1}/{request.num_logos}...")
-                        
-                        # Create unique seed for each logo
-                        seed = (hash(request.business_name) + i * 1000) % 2**32
-                        generator = torch.manual_seed(seed)
-                        
-                        # Ultra-fast generation for free tier
-                        try:
-                            logger.debug(f"Calling SD pipeline for logo {i+1}...")
-                            result = self.sd_pipeline(
-                                prompt=logo_prompt,
-                                negative_prompt=negative_prompt,
-                                num_images_per_prompt=1,
-                                num_inference_steps=4,   # ULTRA FAST - 4 steps only
-                                guidance_scale=3.5,      # Lower guidance for speed
-                                width=256,               # Smaller for t2.micro
-                                height=256,              # Smaller for t2.micro
-                                generator=generator,
-                                output_type="pil"
-                            )
-                            
-                            if result and hasattr(result, 'images') and result.images:
-                                images.append(result.images[0])
-                                logger.info(f"Successfully generated logo {i+1}")
-                            else:
-                                logger.warning(f"No image generated for logo {i+1}")
-                                
-                        except Exception as gen_e:
-                            logger.error(f"Failed to generate logo {i+1}: {gen_e}")
-                            # Continue with next logo instead of failing completely
-                            continue
+                # Logos from this and any concurrent requests share one batched call,
+                # packing the UNet GEMMs; per-image generators keep distinct seeds
+                images = []
+                # crc32 rather than hash(): str hashes are salted per process, which
+                # would give the same request different logos after every restart.
+                # The generators stay on CPU even when running on CUDA: diffusers draws
+                # the latents there and moves them, so a seed gives the same logo on both
+                base_seed = zlib.crc32(request.business_name.encode('utf-8'))
+                generators = [
+                    torch.Generator().manual_seed((base_seed + i * 2654435761) & 0xFFFFFFFF)
+                    for i in range(request.num_logos)
+                ]
+                
+                try:
+                    images = await self._generate_sd_images(logo_prompt, negative_prompt, generators)
+                    
+                    if not images:
+                        logger.warning("No images generated by SD pipeline")
                         
-                        # Small delay to prevent overwhelming CPU
-                        await asyncio.sleep(0.5)
+                except Exception as gen_e:
+                    logger.error(f"Failed to generate logos: {gen_e}")
+                
                 logger.info(f"Successfully generated {len(images)} logos with SD pipeline")
                 
                 # If no images were generated, fall back to placeholder
@@ -356,35 +850,16 @@ class BrandService:
                     logger.warning("No images generated by SD pipeline, falling back to placeholder")
                     return await self._generate_fallback_logos(request)
                 
-                for i, img in enumerate(images):
-                    logo_id = str(uuid.uuid4())
-                    
-                    # Enhance the generated logo
-                    enhanced_img = self._enhance_logo(img)
-                    
-                    # Save to file and get URL
-                    logo_path = os.path.join(self.logos_dir, f"{logo_id}.png")
-                    enhanced_img.save(logo_path)
-                    
-                    # Convert to base64 for immediate display
-                    logo_url = self._image_to_data_url(enhanced_img)
-                    
-                    logo_result = LogoResult(
-                        id=logo_id,
-                        url=logo_url,
-                        thumbnail_url=logo_url,
-                        style_confidence=0.85 + (i * 0.05),
-                        quality_score=0.90 + (i * 0.02),
-                        metadata={
-                            "style": request.style,
-                            "industry": request.industry,
-                            "prompt_used": logo_prompt[:150] + "..." if len(logo_prompt) > 150 else logo_prompt,
-                            "file_path": logo_path,
-                            "generated_with": "stable_diffusion"
-                        }
-                    )
-                    
-                    logos.append(logo_result)
+                # Enhance, encode and save every image in parallel worker threads;
+                # PIL's filters and zlib release the GIL
+                results = await asyncio.gather(*(
+                    asyncio.to_thread(self._postprocess_generated_logo, img, i, request, logo_prompt)
+                    for i, img in enumerate(images)
+                ))
+                logos = [logo for logo, _ in results]
+                # Hand the decoded images to _enhance_logos instead of re-reading the files
+                if logo_images is not None:
+                    logo_images.update((logo.id, image) for logo, image in results)
             else:
                 logger.warning("Stable Diffusion not available, using fallback")
                 return await self._generate_fallback_logos(request)
@@ -408,15 +883,15 @@ class BrandService:
         logger.info("Generating fallback placeholder logos")
         
         try:
-            logos = []
-            for i in range(request.num_logos):
-                logo_id = str(uuid.uuid4())
-                logger.info(f"Creating placeholder logo {i+1}/{request.num_logos}...")
-                
-                logo_url = await self._create_placeholder_logo(request, i)
-                
-                logo_result = LogoResult(
-                    id=logo_id,
+            logger.info(f"Creating {request.num_logos} placeholder logos...")
+            logo_urls = await asyncio.gather(
+                *(self._create_placeholder_logo(request, i) for i in range(request.num_logos))
+            )
+            
+            prompt_used = request.prompt[:100] + "..." if len(request.prompt) > 100 else request.prompt
+            logos = [
+                LogoResult(
+                    id=str(uuid.uuid4()),
                     url=logo_url,
                     thumbnail_url=logo_url,
                     style_confidence=0.75 + (i * 0.05),
@@ -424,14 +899,13 @@ class BrandService:
                     metadata={
                         "style": request.style,
                         "industry": request.industry,
-                        "prompt_used": request.prompt[:100] + "..." if len(request.prompt) > 100 else request.prompt,
+                        "prompt_used": prompt_used,
                         "generated_with": "placeholder_fallback",
                         "business_name": request.business_name
                     }
                 )
-                
-                logos.append(logo_result)
-                await asyncio.sleep(0.2)  # Small delay
+                for i, logo_url in enumerate(logo_urls)
+            ]
             
             logger.info(f"Successfully generated {len(logos)} fallback logos")
             return logos
@@ -444,127 +918,177 @@ class BrandService:
         """Create a placeholder logo for testing (replace with actual AI generation)"""
         try:
             # Create a simple colored rectangle as placeholder
-            color_map = {
-                "warm": ["#D2691E", "#CC5500", "#FFB000"],
-                "cool": ["#4A90E2", "#357ABD", "#2E86C1"],
-                "neutral": ["#6B6B6B", "#8B8B8B", "#A0A0A0"],
-                "vibrant": ["#FF6B6B", "#4ECDC4", "#45B7D1"]
-            }
-            
-            colors = color_map.get(request.color_scheme, ["#333333", "#666666", "#999999"])
+            colors = _PLACEHOLDER_COLOR_MAP.get(request.color_scheme, _DEFAULT_PLACEHOLDER_COLORS)
             color = colors[index % len(colors)]
             
-            # Create a simple logo placeholder
-            img = Image.new('RGB', (512, 512), color)
+            cached = self._placeholder_cache.get(color)
+            if cached is not None:
+                return cached
             
-            # Convert to base64 data URL for immediate display
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            
-            # Return as data URL for immediate display
-            return f"data:image/png;base64,{img_data}"
+            # PNG encoding is CPU-bound, keep it off the event loop
+            data_url = await asyncio.to_thread(self._render_placeholder_png, color)
+            self._placeholder_cache[color] = data_url
+            return data_url
             
         except Exception as e:
             logger.error(f"Placeholder logo creation failed: {e}")
-            return "data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNTEyIiBoZWlnaHQ9IjUxMiIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj48cmVjdCB3aWR0aD0iMTAwJSIgaGVpZ2h0PSIxMDAlIiBmaWxsPSIjY2NjIi8+PHRleHQgeD0iNTAlIiB5PSI1MCUiIGZvbnQtZmFtaWx5PSJBcmlhbCwgc2Fucy1zZXJpZiIgZm9udC1zaXplPSIxOCIgZmlsbD0iIzMzMyIgdGV4dC1hbmNob3I9Im1pZGRsZSIgZHk9Ii4zZW0iPkxvZ28gUGxhY2Vob2xkZXI8L3RleHQ+PC9zdmc+"
+            return _FALLBACK_LOGO_DATA_URL
+    
+    def _render_placeholder_png(self, color: str) -> str:
+        """Render a solid-color 512x512 placeholder as a PNG data URL"""
+        img = Image.new('RGB', (512, 512), color)
+        
+        # A solid color compresses to almost nothing at any level, so use the fastest
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG', compress_level=1, optimize=False)
+        return _png_data_url(buffer.getbuffer())
+    
+    def _encode_sd_prompt(self, prompt: str, negative_prompt: Optional[str]):
+        """Run the text encoder once per distinct prompt pair; the pipeline repeats the embeddings per image"""
+        key = (prompt, negative_prompt)
+        cached = self._prompt_embeds_cache.get(key)
+        if cached is not None:
+            self._prompt_embeds_cache.move_to_end(key)
+            return cached
+        
+        embeds = self.sd_pipeline.encode_prompt(
+            prompt,
+            device=self.device,
+            num_images_per_prompt=1,
+            do_classifier_free_guidance=negative_prompt is not None,
+            negative_prompt=negative_prompt
+        )
+        self._prompt_embeds_cache[key] = embeds
+        while len(self._prompt_embeds_cache) > _PROMPT_EMBEDS_CACHE_SIZE:
+            self._prompt_embeds_cache.popitem(last=False)
+        return embeds
     
     def _build_sd_prompt(self, request: BrandRequest) -> str:
         """Build optimized Stable Diffusion prompt for logo generation"""
         personality_str = ", ".join(request.personality_traits[:3])
         
-        # Base prompt optimized for logo generation
-        base_prompt = f"professional logo design, {request.business_name}, {request.industry} company"
-        
-        # Style modifiers
-        style_modifiers = {
-            "minimal": "clean minimalist design, simple geometric shapes, flat design",
-            "geometric": "geometric shapes, mathematical precision, modern clean lines",
-            "text-based": "typography focused, lettering design, font-based logo",
-            "symbolic": "symbolic representation, meaningful icons, brand symbols",
-            "abstract": "abstract forms, creative interpretation, artistic shapes",
-            "classic": "timeless design, traditional elements, elegant composition"
-        }
-        
-        style_desc = style_modifiers.get(request.style, "minimalist design")
-        
-        # Industry-specific elements
-        industry_elements = {
-            "technology": "subtle tech elements, digital symbols, innovation themes",
-            "healthcare": "medical symbols, care icons, trust elements",
-            "education": "knowledge symbols, learning icons, growth elements",
-            "finance": "stability symbols, trust icons, prosperity elements",
-            "retail": "commerce symbols, shopping icons, consumer appeal",
-            "food": "organic shapes, appetite appeal, freshness symbols",
-            "fashion": "elegant design, style elements, luxury appeal",
-            "automotive": "motion symbols, power elements, reliability icons",
-            "real-estate": "stability symbols, home icons, growth elements",
-            "consulting": "expertise symbols, guidance icons, professional elements",
-            "creative": "artistic elements, creative symbols, imagination icons"
-        }
-        
-        industry_desc = industry_elements.get(request.industry, "professional symbols")
+        suffix = _SD_PROMPT_SUFFIXES.get((request.style, request.industry))
+        if suffix is None:
+            suffix = _sd_prompt_suffix(request.style, request.industry)
         
-        # Quality enhancers
-        quality_terms = [
-            "high quality vector style",
-            "clean white background", 
-            "professional branding",
-            "scalable design",
-            "corporate identity",
-            f"{personality_str} personality"
-        ]
-        
-        return f"{base_prompt}, {style_desc}, {industry_desc}, {', '.join(quality_terms)}"
+        # Base prompt optimized for logo generation, then style, industry and quality terms
+        return (
+            f"professional logo design, {request.business_name}, {request.industry} company, "
+            f"{suffix}, {personality_str} personality"
+        )
     
     def _build_sd_negative_prompt(self, request: BrandRequest) -> str:
         """Build negative prompt to avoid unwanted elements"""
-        negative_elements = [
-            "blurry", "pixelated", "low quality", "text artifacts",
-            "complex details", "realistic photo", "3d render",
-            "multiple logos", "watermark", "signature", "cluttered",
-            "amateur", "unprofessional", "distorted", "ugly"
-        ]
+        return _SD_NEGATIVE_PROMPTS.get(request.industry, _SD_BASE_NEGATIVE_PROMPT)
+    
+    async def _generate_sd_images(self, prompt: str, negative_prompt: Optional[str],
+                                  generators: list) -> List[Image.Image]:
+        """Queue one request's images for the next batched SD pipeline call"""
+        future = asyncio.get_running_loop().create_future()
+        self._sd_pending.append((prompt, negative_prompt, generators, future))
+        if self._sd_batch_task is None:
+            self._sd_batch_task = asyncio.create_task(self._run_sd_batches())
+        return await future
+    
+    async def _run_sd_batches(self):
+        """Drain queued requests in batches of up to sd_max_batch_images, one pipeline call at a time"""
+        try:
+            while self._sd_pending:
+                # This task is the only pipeline caller, so nothing is in flight here.
+                # A lone request runs straight away; when others are already queued,
+                # give more concurrent requests a moment to join the batch
+                if len(self._sd_pending) > 1:
+                    await asyncio.sleep(self.settings.sd_batch_window_ms / 1000)
+                
+                batch, num_images = [], 0
+                while self._sd_pending and (
+                    not batch or num_images + len(self._sd_pending[0][2]) <= self.settings.sd_max_batch_images
+                ):
+                    item = self._sd_pending.pop(0)
+                    # Skip requests that were cancelled (e.g. timed out) while queued
+                    if not item[3].done():
+                        batch.append(item)
+                        num_images += len(item[2])
+                if not batch:
+                    continue
+                
+                try:
+                    # Inference blocks for seconds; keep the event loop serving other requests
+                    results = await asyncio.to_thread(self._run_sd_pipeline_batch, batch)
+                except Exception as e:
+                    for *_, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for (*_, future), images in zip(batch, results):
+                        if not future.done():
+                            future.set_result(images)
+        finally:
+            self._sd_batch_task = None
+    
+    def _run_sd_pipeline_batch(self, batch: List[tuple]) -> List[List[Image.Image]]:
+        """Run one pipeline call for several requests and split the images back per request"""
+        counts = [len(generators) for _, _, generators, _ in batch]
         
-        # Add industry-specific negatives
-        industry_negatives = {
-            "technology": "circuit boards, gears, lightbulbs, atoms",
-            "healthcare": "red crosses, stethoscopes, pills, syringes",
-            "education": "graduation caps, apples, books, pencils",
-            "finance": "dollar signs, coins, piggy banks, graphs",
-            "retail": "shopping carts, price tags, bags",
-            "food": "chef hats, forks and knives, plates",
-            "fashion": "hangers, mannequins, sewing machines",
-            "automotive": "car silhouettes, wheels, keys",
-            "real-estate": "house shapes, keys, rooftops",
-            "consulting": "handshakes, briefcases, ties",
-            "creative": "paint brushes, palettes, easels"
-        }
+        # no_grad is thread-local, so enter it in the worker thread
+        with torch.no_grad():
+            embeds = [self._encode_sd_prompt(prompt, negative_prompt) for prompt, negative_prompt, _, _ in batch]
+            prompt_embeds = torch.cat([
+                positive.expand(count, -1, -1) for (positive, _), count in zip(embeds, counts)
+            ])
+            # guidance_scale is global, so either every request has negative embeddings or none does
+            negative_prompt_embeds = None
+            if embeds[0][1] is not None:
+                negative_prompt_embeds = torch.cat([
+                    negative.expand(count, -1, -1) for (_, negative), count in zip(embeds, counts)
+                ])
+            
+            # Ultra-fast generation for free tier
+            result = self.sd_pipeline(
+                prompt_embeds=prompt_embeds,
+                negative_prompt_embeds=negative_prompt_embeds,
+                num_images_per_prompt=1,
+                num_inference_steps=self.settings.sd_num_inference_steps,
+                guidance_scale=self.settings.sd_guidance_scale,
+                width=256,               # Smaller for t2.micro
+                height=256,              # Smaller for t2.micro
+                generator=[generator for _, _, generators, _ in batch for generator in generators],
+                # Keep the batch as a tensor so background removal runs on
+                # it before the single device-to-host copy
+                output_type="pt"
+            )
+            images = self._sd_images_to_rgba(result.images)
+        
+        per_request, start = [], 0
+        for count in counts:
+            per_request.append(images[start:start + count])
+            start += count
+        return per_request
+    
+    def _sd_images_to_rgba(self, images) -> List[Image.Image]:
+        """Quantize a [N, 3, H, W] pipeline batch and remove its background on-device, copying to host once"""
+        rgb = (images.float().clamp(0, 1) * 255).round().to(torch.uint8)
         
-        if request.industry in industry_negatives:
-            negative_elements.append(industry_negatives[request.industry])
+        # Same rule as _enhance_logo: pixels with all channels above 240 become transparent white
+        background = (rgb > 240).all(dim=1, keepdim=True)
+        rgb = rgb.masked_fill(background, 255)
+        alpha = (~background).to(torch.uint8) * 255
         
-        return ", ".join(negative_elements)
+        rgba = torch.cat([rgb, alpha], dim=1).permute(0, 2, 3, 1).contiguous().cpu().numpy()
+        return [Image.fromarray(arr, 'RGBA') for arr in rgba]
     
     def _enhance_logo(self, image: Image.Image) -> Image.Image:
         """Enhance generated logo for professional use"""
         try:
-            # Convert to RGBA for transparency support
+            # RGBA images from _sd_images_to_rgba already had their background
+            # removed on-device; anything else gets the same mask here
             if image.mode != 'RGBA':
-                image = image.convert('RGBA')
-            
-            # Remove background by making white pixels transparent
-            data = image.getdata()
-            new_data = []
-            
-            for item in data:
-                # Make white and near-white pixels transparent
-                if item[0] > 240 and item[1] > 240 and item[2] > 240:
-                    new_data.append((255, 255, 255, 0))  # Transparent
-                else:
-                    new_data.append(item)
-            
-            image.putdata(new_data)
+                # Remove background by making white and near-white pixels transparent,
+                # as one vectorized mask over the whole image
+                arr = np.array(image.convert('RGBA'))
+                mask = (arr[..., 0] > 240) & (arr[..., 1] > 240) & (arr[..., 2] > 240)
+                arr[mask] = (255, 255, 255, 0)
+                image = Image.fromarray(arr, 'RGBA')
             
             # Apply slight sharpening
             image = image.filter(ImageFilter.UnsharpMask(radius=1, percent=50, threshold=2))
@@ -578,140 +1102,137 @@ class BrandService:
         """Convert PIL Image to data URL for immediate display"""
         try:
             buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            img_data = base64.b64encode(buffer.getvalue()).decode()
-            return f"data:image/png;base64,{img_data}"
+            image.save(buffer, format='PNG', compress_level=1, optimize=False)
+            return _png_data_url(buffer.getbuffer())
         except Exception as e:
             logger.error(f"Failed to convert image to data URL: {e}")
             return ""
     
+    def _postprocess_generated_logo(self, img: Image.Image, index: int, request: BrandRequest,
+                                    logo_prompt: str) -> Tuple[LogoResult, Image.Image]:
+        """Enhance a generated image, save it and build its LogoResult; also returns the enhanced image"""
+        logo_id = str(uuid.uuid4())
+        enhanced_img = self._enhance_logo(img)
+        
+        # Save to file and get a base64 URL for immediate display
+        logo_path = os.path.join(self.logos_dir, f"{logo_id}.png")
+        logo_url = self._save_png_data_url(enhanced_img, logo_path)
+        thumbnail_url = self._image_to_thumbnail_data_url(enhanced_img)
+        
+        logo = LogoResult(
+            id=logo_id,
+            url=logo_url,
+            thumbnail_url=thumbnail_url,
+            style_confidence=0.85 + (index * 0.05),
+            quality_score=0.90 + (index * 0.02),
+            metadata={
+                "style": request.style,
+                "industry": request.industry,
+                "prompt_used": logo_prompt[:150] + "..." if len(logo_prompt) > 150 else logo_prompt,
+                "file_path": logo_path,
+                "generated_with": "stable_diffusion"
+            }
+        )
+        return logo, enhanced_img
+    
+    def _save_png_data_url(self, image: Image.Image, path: str) -> str:
+        """Encode image as PNG once, write it to path and return the same bytes as a data URL"""
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', compress_level=1)
+        png_bytes = buffer.getbuffer()
+        _write_bytes(path, png_bytes)
+        
+        return _png_data_url(png_bytes)
+    
+    def _image_to_thumbnail_data_url(self, image: Image.Image) -> str:
+        """Convert PIL Image to a small thumbnail data URL"""
+        if image.width <= _THUMBNAIL_SIZE[0] and image.height <= _THUMBNAIL_SIZE[1]:
+            return self._image_to_data_url(image)
+        
+        thumbnail = image.copy()
+        thumbnail.thumbnail(_THUMBNAIL_SIZE)
+        return self._image_to_data_url(thumbnail)
+    
     def _extract_colors_from_logo(self, image: Image.Image) -> list:
         """Extract dominant colors from logo with CSS color names"""
         try:
-            # Save image to temporary file for ColorThief
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                image.save(temp_file.name, 'PNG')
-                
-                # Extract colors
-                color_thief = ColorThief(temp_file.name)
-                
-                # Get dominant color
-                dominant_color = color_thief.get_color(quality=1)
-                
-                # Get color palette (more colors for better variety)
-                try:
-                    palette = color_thief.get_palette(color_count=10, quality=1)
-                except:
-                    palette = [dominant_color] * 6
-                
-                # Convert to colors with CSS names and hex values
-                color_info = []
-                for rgb in palette[:8]:  # Limit to 8 colors
-                    hex_color = '#{:02x}{:02x}{:02x}'.format(rgb[0], rgb[1], rgb[2])
-                    
-                    # Get CSS color name or closest match
-                    css_name = self._get_css_color_name(rgb)
-                    
-                    color_info.append({
-                        'hex': hex_color,
-                        'rgb': f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})',
-                        'name': css_name,
-                        'rgb_values': rgb
-                    })
-                
-                # Clean up temp file
-                os.unlink(temp_file.name)
+            # Median cut (the algorithm ColorThief implements) runs in Pillow's C
+            # quantizer on a downscaled copy, with no temp file round trip
+            small = image.convert('RGBA')
+            small.thumbnail((128, 128), Image.Resampling.NEAREST)  # sample pixels, don't blend new colors
+            
+            # Like ColorThief, ignore transparent and near-white background pixels
+            pixels = np.asarray(small).reshape(-1, 4)
+            keep = (pixels[:, 3] >= 125) & ~((pixels[:, 0] > 250) & (pixels[:, 1] > 250) & (pixels[:, 2] > 250))
+            if keep.any():
+                pixels = pixels[keep]
+            strip = Image.fromarray(np.ascontiguousarray(pixels[:, :3]).reshape(1, -1, 3), 'RGB')
+            
+            # Flat logos with at most 8 distinct colors need no quantization;
+            # getcolors gives up (returns None) as soon as it sees a 9th color
+            exact_colors = strip.getcolors(maxcolors=8)
+            if exact_colors is not None:
+                rgb = np.array([color for _, color in sorted(exact_colors, reverse=True)], dtype=np.uint8)
+            else:
+                quantized = strip.quantize(colors=10, method=Image.Quantize.MEDIANCUT)
+                palette = np.array(quantized.getpalette(), dtype=np.uint8).reshape(-1, 3)
                 
-                return color_info
+                # Palette as a (K, 3) array, most dominant first; limit to 8 colors
+                order = [index for _, index in sorted(quantized.getcolors(), reverse=True)[:8]]
+                rgb = palette[order]
+            names = self._css_color_names(rgb)
+            
+            # Convert to colors with CSS names and hex values
+            return [
+                {
+                    'hex': '#%02x%02x%02x' % values,
+                    'rgb': 'rgb(%d, %d, %d)' % values,
+                    'name': name,
+                    'rgb_values': values
+                }
+                for values, name in zip(map(tuple, rgb.tolist()), names)
+            ]
                 
         except Exception as e:
             logger.error(f"Color extraction failed: {e}")
             # Return default colors with names
-            return [
-                {'hex': '#333333', 'rgb': 'rgb(51, 51, 51)', 'name': 'Dark Gray', 'rgb_values': (51, 51, 51)},
-                {'hex': '#666666', 'rgb': 'rgb(102, 102, 102)', 'name': 'Gray', 'rgb_values': (102, 102, 102)},
-                {'hex': '#999999', 'rgb': 'rgb(153, 153, 153)', 'name': 'Light Gray', 'rgb_values': (153, 153, 153)},
-                {'hex': '#CCCCCC', 'rgb': 'rgb(204, 204, 204)', 'name': 'Silver', 'rgb_values': (204, 204, 204)},
-                {'hex': '#FF6B6B', 'rgb': 'rgb(255, 107, 107)', 'name': 'Light Coral', 'rgb_values': (255, 107, 107)},
-                {'hex': '#4ECDC4', 'rgb': 'rgb(78, 205, 196)', 'name': 'Medium Turquoise', 'rgb_values': (78, 205, 196)}
-            ]
+            return _DEFAULT_EXTRACTED_COLORS
     
-    def _get_css_color_name(self, rgb_tuple):
-        """Get CSS color name from RGB values using webcolors"""
-        try:
-            # Try exact match first
-            return webcolors.rgb_to_name(rgb_tuple)
-        except ValueError:
-            # Find closest CSS3 color
-            try:
-                return webcolors.rgb_to_name(rgb_tuple, spec='css3')
-            except ValueError:
-                # Find closest match by calculating distance
-                min_distance = float('inf')
-                closest_name = 'Unknown'
-                
-                # Check against common CSS colors
-                css_colors = {
-                    'red': (255, 0, 0), 'green': (0, 128, 0), 'blue': (0, 0, 255),
-                    'yellow': (255, 255, 0), 'orange': (255, 165, 0), 'purple': (128, 0, 128),
-                    'pink': (255, 192, 203), 'brown': (165, 42, 42), 'gray': (128, 128, 128),
-                    'black': (0, 0, 0), 'white': (255, 255, 255), 'navy': (0, 0, 128),
-                    'teal': (0, 128, 128), 'olive': (128, 128, 0), 'maroon': (128, 0, 0),
-                    'lime': (0, 255, 0), 'aqua': (0, 255, 255), 'fuchsia': (255, 0, 255),
-                    'silver': (192, 192, 192), 'coral': (255, 127, 80), 'salmon': (250, 128, 114)
-                }
-                
-                for color_name, color_rgb in css_colors.items():
-                    distance = sum((a - b) ** 2 for a, b in zip(rgb_tuple, color_rgb)) ** 0.5
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_name = color_name.title()
-                
-                return closest_name
+    def _css_color_names(self, rgb: np.ndarray) -> List[str]:
+        """Get CSS color names for a (K, 3) array of RGB values"""
+        # Squared distance from every color to every CSS3 color in one broadcast
+        distances = ((rgb[:, None, :].astype(np.int32) - _CSS3_COLOR_RGB[None, :, :]) ** 2).sum(axis=2)
+        nearest = distances.argmin(axis=1)
+        exact = distances[np.arange(len(rgb)), nearest] == 0
+        
+        # Exact matches keep the webcolors name, closest matches are title-cased
+        return [
+            _CSS3_COLOR_NAMES[index] if is_exact else _CSS3_COLOR_NAMES[index].title()
+            for index, is_exact in zip(nearest.tolist(), exact.tolist())
+        ]
     
     def _generate_color_variations(self, original_image: Image.Image) -> List[Image.Image]:
         """Generate color variations of the logo with different hues and saturations"""
         try:
             variations = []
             
-            # Convert to numpy array for processing
-            img_array = np.array(original_image.convert('RGB'))
-            
-            # Convert RGB to HSV for color manipulation
-            hsv_array = color.rgb2hsv(img_array)
+            # Pillow's HSV mode keeps every channel uint8 (hue spans 0-255)
+            rgb_image = original_image if original_image.mode == 'RGB' else original_image.convert('RGB')
+            hue, saturation, value = rgb_image.convert('HSV').split()
             
-            # Define variation parameters
-            hue_shifts = [0.0, 0.15, 0.3, 0.45, 0.6, 0.75]  # Different hue shifts
-            saturation_mults = [0.7, 0.85, 1.0, 1.15, 1.3, 1.5]  # Saturation multipliers
+            # Preserve alpha channel if original had transparency
+            alpha = original_image.getchannel('A') if original_image.mode == 'RGBA' else None
             
-            for i, (hue_shift, sat_mult) in enumerate(zip(hue_shifts, saturation_mults)):
-                # Create a copy of HSV array
-                variation_hsv = hsv_array.copy()
-                
-                # Apply hue shift
-                variation_hsv[:, :, 0] = (variation_hsv[:, :, 0] + hue_shift) % 1.0
-                
-                # Apply saturation multiplication (clip to valid range)
-                variation_hsv[:, :, 1] = np.clip(variation_hsv[:, :, 1] * sat_mult, 0, 1)
-                
-                # Convert back to RGB
-                variation_rgb = color.hsv2rgb(variation_hsv)
+            for hue_lut, saturation_lut in _COLOR_VARIATION_LUTS:
+                # Shift hue and scale saturation through lookup tables, then convert back to RGB
+                variation_img = Image.merge(
+                    'HSV', (hue.point(hue_lut), saturation.point(saturation_lut), value)
+                ).convert('RGB')
                 
-                # Convert to PIL Image
-                variation_img = Image.fromarray((variation_rgb * 255).astype(np.uint8))
-                
-                # Preserve alpha channel if original had transparency
-                if original_image.mode == 'RGBA':
-                    variation_img = variation_img.convert('RGBA')
-                    # Copy alpha channel from original
-                    alpha = original_image.split()[-1]
+                if alpha is not None:
                     variation_img.putalpha(alpha)
                 
                 variations.append(variation_img)
-                
-                # Limit to 6 variations to avoid overwhelming the user
-                if len(variations) >= 6:
-                    break
             
             return variations
             
@@ -720,82 +1241,116 @@ class BrandService:
             # Return original image as fallback
             return [original_image]
     
-    def _upscale_logo(self, image: Image.Image, prompt: str) -> Image.Image:
-        """Upscale logo using Stable Diffusion x4 upscaler"""
-        try:
-            if not self.upscaler_pipeline:
-                logger.warning("Upscaler not available, returning original size")
-                return image
-            
-            # Ensure image is the right size for upscaler (128x128 minimum)
-            if image.size[0] < 128 or image.size[1] < 128:
-                image = image.resize((128, 128), Image.Resampling.LANCZOS)
-            
-            logger.info(f"Upscaling logo from {image.size} to 4x resolution...")
-            
-            # Generate upscaled image
-            upscaled = self.upscaler_pipeline(
-                prompt=prompt,
-                image=image,
-                num_inference_steps=20,
-                guidance_scale=0,  # Use 0 for logo upscaling
-                noise_level=20
-            ).images[0]
-            
-            logger.info(f"Successfully upscaled logo to {upscaled.size}")
-            return upscaled
-            
-        except Exception as e:
-            logger.error(f"Logo upscaling failed: {e}")
-            # Return 2x scaled version as fallback
-            return image.resize((image.size[0] * 2, image.size[1] * 2), Image.Resampling.LANCZOS)
+    def _upscale_logos(self, images: List[Image.Image], prompts: List[str]) -> List[Image.Image]:
+        """Upscale logos using Stable Diffusion x4 upscaler, one pipeline call per batch"""
+        if not self.upscaler_pipeline:
+            logger.warning("Upscaler not available, returning original size")
+            return images
+        
+        # Ensure images are the right size for upscaler (128x128 minimum); BICUBIC
+        # is enough here since the diffusion upscaler dominates the final quality
+        images = [
+            image.resize((max(128, image.size[0]), max(128, image.size[1])), Image.Resampling.BICUBIC)
+            if min(image.size) < 128 else image
+            for image in images
+        ]
+        
+        batch_size = max(1, self.settings.enhance_batch_size)
+        upscaled = []
+        for start in range(0, len(images), batch_size):
+            # Latents are stacked into one tensor, so every image in a batch needs the same size
+            batch_shape = images[start].size
+            batch = [
+                image if image.size == batch_shape else image.resize(batch_shape, Image.Resampling.LANCZOS)
+                for image in images[start:start + batch_size]
+            ]
+            try:
+                logger.info(f"Upscaling {len(batch)} logos to 4x resolution...")
+                
+                # A batched forward pass reuses the loaded weights instead of
+                # paying the per-call overhead once per logo
+                autocast = (
+                    torch.autocast("cuda", dtype=torch.float16)
+                    if self.device == "cuda" else contextlib.nullcontext()
+                )
+                with torch.inference_mode(), autocast:
+                    result = self.upscaler_pipeline(
+                        prompt=prompts[start:start + batch_size],
+                        image=batch,
+                        num_inference_steps=20,
+                        guidance_scale=0,  # Use 0 for logo upscaling
+                        noise_level=20
+                    )
+                upscaled.extend(result.images)
+                
+            except Exception as e:
+                logger.error(f"Logo upscaling failed: {e}")
+                # Return 2x scaled versions as fallback
+                upscaled.extend(
+                    image.resize((image.size[0] * 2, image.size[1] * 2), Image.Resampling.LANCZOS)
+                    for image in batch
+                )
+        
+        return upscaled
     
     def _create_social_media_exports(self, logo: Image.Image, logo_id: str) -> Dict[str, str]:
         """Create social media format exports of the logo"""
         try:
-            export_paths = {}
-            
-            for format_name, (width, height) in self.social_media_formats.items():
-                # Calculate scaling to fit logo while maintaining aspect ratio
-                logo_aspect = logo.size[0] / logo.size[1]
-                target_aspect = width / height
-                
-                if logo_aspect > target_aspect:
-                    # Logo is wider, scale by width
-                    new_width = min(width * 0.8, logo.size[0])  # Use 80% of canvas
-                    new_height = int(new_width / logo_aspect)
-                else:
-                    # Logo is taller, scale by height
-                    new_height = min(height * 0.8, logo.size[1])  # Use 80% of canvas
-                    new_width = int(new_height * logo_aspect)
-                
-                # Resize logo
-                resized_logo = logo.resize((int(new_width), int(new_height)), Image.Resampling.LANCZOS)
-                
-                # Create canvas with white background
-                canvas = Image.new('RGB', (width, height), 'white')
-                
-                # Calculate position to center logo
-                x = (width - resized_logo.size[0]) // 2
-                y = (height - resized_logo.size[1]) // 2
-                
-                # Paste logo onto canvas
-                if resized_logo.mode == 'RGBA':
-                    canvas.paste(resized_logo, (x, y), resized_logo)
-                else:
-                    canvas.paste(resized_logo, (x, y))
-                
-                # Save export
-                export_path = os.path.join(self.social_exports_dir, f"{logo_id}_{format_name}.png")
-                canvas.save(export_path)
-                export_paths[format_name] = export_path
-            
-            return export_paths
+            # Resizing and PNG encoding release the GIL, so formats render in parallel
+            logo.load()  # decode once up front; lazily loaded images are not thread-safe
+            futures = {
+                format_name: self._export_pool.submit(
+                    self._render_social_media_export, logo, logo_id, format_name, width, height
+                )
+                for format_name, (width, height) in self.social_media_formats.items()
+            }
+            return {format_name: future.result() for format_name, future in futures.items()}
             
         except Exception as e:
             logger.error(f"Social media export generation failed: {e}")
             return {}
     
+    def _render_social_media_export(self, logo: Image.Image, logo_id: str, format_name: str,
+                                     width: int, height: int) -> str:
+        """Center the logo on a white canvas of the given size and save it"""
+        # Calculate scaling to fit logo while maintaining aspect ratio
+        logo_aspect = logo.size[0] / logo.size[1]
+        target_aspect = width / height
+        
+        if logo_aspect > target_aspect:
+            # Logo is wider, scale by width
+            new_width = min(width * 0.8, logo.size[0])  # Use 80% of canvas
+            new_height = int(new_width / logo_aspect)
+        else:
+            # Logo is taller, scale by height
+            new_height = min(height * 0.8, logo.size[1])  # Use 80% of canvas
+            new_width = int(new_height * logo_aspect)
+        
+        # Resize logo; for large ratios, box-reduce by the integer factor first so
+        # LANCZOS only filters a small image (the upscaled source is often 4x+)
+        target_size = (int(new_width), int(new_height))
+        factor = min(logo.size[0] // target_size[0], logo.size[1] // target_size[1])
+        source = logo.reduce(factor) if factor >= 2 else logo
+        resized_logo = source.resize(target_size, Image.Resampling.LANCZOS)
+        
+        # Create canvas with white background
+        canvas = Image.new('RGB', (width, height), 'white')
+        
+        # Calculate position to center logo
+        x = (width - resized_logo.size[0]) // 2
+        y = (height - resized_logo.size[1]) // 2
+        
+        # Paste logo onto canvas
+        if resized_logo.mode == 'RGBA':
+            canvas.paste(resized_logo, (x, y), resized_logo)
+        else:
+            canvas.paste(resized_logo, (x, y))
+        
+        # Save export; these are large, mostly flat canvases, so fast zlib is enough
+        export_path = os.path.join(self.social_exports_dir, f"{logo_id}_{format_name}.png")
+        canvas.save(export_path, format='PNG', compress_level=1)
+        return export_path
+    
     async def _generate_color_palette(self, request: BrandRequest) -> ColorPalette:
         """Generate color palette using Brand Knowledge Graph"""
         logger.info(f"Generating color palette for {request.color_scheme} scheme")
@@ -807,94 +1362,23 @@ class BrandService:
             # - Target audience preferences  
             # - Complementary color relationships
             
-            palette_map = {
-                "warm": {
-                    "primary": "#D2691E",
-                    "secondary": "#CC5500", 
-                    "accent": "#FFB000",
-                    "neutral": "#8B4513"
-                },
-                "cool": {
-                    "primary": "#4A90E2",
-                    "secondary": "#357ABD",
-                    "accent": "#2E86C1", 
-                    "neutral": "#708090"
-                },
-                "neutral": {
-                    "primary": "#6B6B6B",
-                    "secondary": "#8B8B8B",
-                    "accent": "#A0A0A0",
-                    "neutral": "#D3D3D3"
-                },
-                "vibrant": {
-                    "primary": "#FF6B6B",
-                    "secondary": "#4ECDC4", 
-                    "accent": "#45B7D1",
-                    "neutral": "#95A5A6"
-                }
-            }
-            
-            colors = palette_map.get(request.color_scheme, palette_map["neutral"])
-            
-            return ColorPalette(
-                primary=colors["primary"],
-                secondary=colors["secondary"],
-                accent=colors["accent"],
-                neutral=colors["neutral"],
-                colors=[colors["primary"], colors["secondary"], colors["accent"], colors["neutral"]]
-            )
+            return _PALETTE_CACHE.get(request.color_scheme, _PALETTE_CACHE["neutral"])
             
         except Exception as e:
             logger.error(f"Color palette generation failed: {e}")
-            # Return default palette
-            return ColorPalette(
-                primary="#333333",
-                secondary="#666666", 
-                accent="#999999",
-                neutral="#CCCCCC",
-                colors=["#333333", "#666666", "#999999", "#CCCCCC"]
-            )
+            return _DEFAULT_PALETTE
     
     async def _generate_typography(self, request: BrandRequest) -> Typography:
         """Generate typography recommendations based on brand personality"""
         logger.info("Generating typography recommendations")
         
         try:
-            # Font recommendations based on personality and industry
-            font_map = {
-                ("professional", "technology"): ("Inter", "Roboto"),
-                ("creative", "fashion"): ("Playfair Display", "Montserrat"),
-                ("friendly", "education"): ("Open Sans", "Lato"),
-                ("modern", "technology"): ("Poppins", "Source Sans Pro"),
-                ("trustworthy", "finance"): ("Georgia", "Times New Roman"),
-                ("innovative", "technology"): ("Helvetica Neue", "Arial"),
-            }
-            
             # Try to match personality + industry, fallback to personality only
-            primary_trait = request.personality_traits[0] if request.personality_traits else "professional"
-            key = (primary_trait, request.industry)
-            
-            if key in font_map:
-                primary_font, secondary_font = font_map[key]
-            else:
-                # Fallback based on personality only
-                personality_fonts = {
-                    "professional": ("Inter", "Roboto"),
-                    "creative": ("Playfair Display", "Montserrat"),
-                    "friendly": ("Open Sans", "Lato"),
-                    "modern": ("Poppins", "Source Sans Pro"),
-                    "trustworthy": ("Georgia", "Times New Roman"),
-                    "innovative": ("Helvetica Neue", "Arial")
-                }
-                primary_font, secondary_font = personality_fonts.get(primary_trait, ("Inter", "Roboto"))
-            
-            return Typography(
-                primary_font=primary_font,
-                secondary_font=secondary_font,
-                font_family="sans-serif" if primary_font in ["Inter", "Roboto", "Open Sans", "Lato", "Poppins", "Helvetica Neue", "Arial"] else "serif",
-                font_style="regular",
-                weight="400"
-            )
+            trait = (request.personality_traits or ("professional",))[0]
+            typography = _TYPOGRAPHY_CACHE.get((trait, request.industry))
+            if typography is None:
+                typography = _build_typography(*_PERSONALITY_FONTS.get(trait, _DEFAULT_FONT_PAIR))
+            return typography
             
         except Exception as e:
             logger.error(f"Typography generation failed: {e}")
@@ -907,125 +1391,286 @@ class BrandService:
     async def _generate_brand_description(self, request: BrandRequest) -> str:
         """Generate brand description using LLM"""
         logger.info("Generating brand description")
+        audience = request.target_audience.replace('-', ' ')
         
         try:
             # Placeholder brand description generation
             # In a real implementation, you would use an LLM to generate
             # a comprehensive brand description based on the request
             
-            personality_text = ", ".join(request.personality_traits)
-            
-            description = f"""
-{request.business_name} is a {personality_text} {request.industry} company that serves {request.target_audience.replace('-', ' ')}. 
-
-The brand embodies a {request.style} aesthetic with {request.color_scheme} tones, reflecting the company's commitment to innovation and excellence in the {request.industry} sector.
-
-{request.business_name} stands out through its unique approach to combining traditional values with modern solutions, creating a trustworthy yet forward-thinking brand identity that resonates with its target market.
-            """.strip()
-            
-            if request.additional_notes:
-                description += f"\n\nAdditional considerations: {request.additional_notes}"
-            
-            return description
+            return _describe_brand(
+                request.business_name,
+                request.personality_traits,
+                request.industry,
+                audience,
+                request.style,
+                request.color_scheme,
+                request.additional_notes
+            )
             
         except Exception as e:
             logger.error(f"Brand description generation failed: {e}")
-            return f"A {request.industry} company focused on serving {request.target_audience.replace('-', ' ')} with innovative solutions."
+            return f"A {request.industry} company focused on serving {audience} with innovative solutions."
     
-    async def _enhance_logos(self, logos: List[LogoResult]) -> List[LogoResult]:
+    async def _enhance_logos(self, logos: List[LogoResult],
+                             logo_images: Optional[Dict[str, Image.Image]] = None) -> List[LogoResult]:
         """Apply comprehensive logo enhancement including upscaling, color variations, and social exports"""
         logger.info("Enhancing logos with upscaling, color variations, and social media exports")
         
         try:
-            enhanced_logos = []
-            
-            for i, logo in enumerate(logos):
-                logger.info(f"Processing logo {i+1}/{len(logos)}...")
-                
-                # Load the original image from file path if available
-                original_image = None
-                if 'file_path' in logo.metadata and os.path.exists(logo.metadata['file_path']):
-                    original_image = Image.open(logo.metadata['file_path'])
-                else:
-                    # Convert from data URL if no file path
-                    try:
-                        if logo.url.startswith('data:image'):
-                            img_data = logo.url.split(',')[1]
-                            img_bytes = base64.b64decode(img_data)
-                            original_image = Image.open(io.BytesIO(img_bytes))
-                    except:
-                        logger.warning(f"Could not load image for logo {logo.id}")
-                        enhanced_logos.append(logo)
-                        continue
-                
-                if original_image is None:
-                    enhanced_logos.append(logo)
-                    continue
-                
-                # 1. Extract colors from the logo
-                extracted_colors = self._extract_colors_from_logo(original_image)
-                
-                # 2. Generate color variations
-                color_variations = self._generate_color_variations(original_image)
-                
-                # 3. Apply upscaling to original logo
-                prompt_for_upscale = logo.metadata.get('prompt_used', 'high quality professional logo')
-                upscaled_logo = self._upscale_logo(original_image, prompt_for_upscale)
-                
-                # 4. Save upscaled version
-                upscaled_path = os.path.join(self.logos_dir, f"{logo.id}_upscaled.png")
-                upscaled_logo.save(upscaled_path)
-                
-                # 5. Create social media exports
-                social_exports = self._create_social_media_exports(upscaled_logo, logo.id)
-                
-                # 6. Save color variations
-                variation_paths = []
-                for j, variation in enumerate(color_variations):
-                    variation_path = os.path.join(self.variations_dir, f"{logo.id}_variation_{j}.png")
-                    variation.save(variation_path)
-                    variation_paths.append({
-                        'path': variation_path,
-                        'url': self._image_to_data_url(variation)
-                    })
-                
-                # Create enhanced logo result with all new features
-                enhanced_logo = LogoResult(
-                    id=logo.id,
-                    url=self._image_to_data_url(upscaled_logo),  # Use upscaled version as main
-                    thumbnail_url=logo.url,  # Keep original as thumbnail
-                    style_confidence=min(logo.style_confidence + 0.1, 1.0),
-                    quality_score=min(logo.quality_score + 0.15, 1.0),
-                    metadata={
-                        **logo.metadata,
-                        "enhanced": True,
-                        "upscaled": True,
-                        "upscaled_path": upscaled_path,
-                        "original_size": original_image.size,
-                        "upscaled_size": upscaled_logo.size,
-                        "extracted_colors": extracted_colors,
-                        "color_variations": variation_paths,
-                        "social_exports": social_exports,
-                        "enhancement_features": [
-                            "4x_upscaling", 
-                            "color_extraction", 
-                            "color_variations", 
-                            "social_media_exports"
-                        ]
-                    }
+            # Generated logos come with their in-memory images; only the rest (placeholders)
+            # are decoded, all up front so the upscaler sees them as one batch
+            logo_images = logo_images or {}
+            images = [logo_images.get(logo.id) for logo in logos]
+            missing = [i for i, image in enumerate(images) if image is None]
+            if missing:
+                decoded = await asyncio.to_thread(lambda: [self._load_logo_image(logos[i]) for i in missing])
+                for i, image in zip(missing, decoded):
+                    images[i] = image
+            loaded = [(logo, image) for logo, image in zip(logos, images) if image is not None]
+            if not loaded:
+                return logos
+            
+            prompts = [logo.metadata.get('prompt_used', 'high quality professional logo') for logo, _ in loaded]
+            # The upscaler pipeline and its scheduler keep per-call state, so
+            # concurrent requests take turns rather than sharing it across threads
+            async with self._upscaler_lock:
+                upscaled_logos = await asyncio.to_thread(
+                    self._upscale_logos, [image for _, image in loaded], prompts
                 )
-                
-                enhanced_logos.append(enhanced_logo)
-                
-                # Small delay to prevent overwhelming the system
-                await asyncio.sleep(0.5)
             
-            return enhanced_logos
+            # Color extraction, variations and exports are CPU-bound and independent
+            # per logo; run them in parallel worker threads, off the event loop
+            async def enhance_one(logo: LogoResult, original_image: Image.Image, upscaled_logo: Image.Image):
+                async with self._enhance_semaphore:
+                    await asyncio.to_thread(self._apply_logo_enhancement, logo, original_image, upscaled_logo)
+            
+            results = await asyncio.gather(*(
+                enhance_one(logo, original_image, upscaled_logo)
+                for (logo, original_image), upscaled_logo in zip(loaded, upscaled_logos)
+            ), return_exceptions=True)
+            
+            for (logo, _), result in zip(loaded, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Enhancement failed for logo {logo.id}: {result}")
+            
+            return logos
             
         except Exception as e:
             logger.error(f"Logo enhancement failed: {e}")
             return logos  # Return original logos if enhancement fails
     
+    def _load_logo_image(self, logo: LogoResult) -> Optional[Image.Image]:
+        """Load a logo's image from its saved file or, failing that, its data URL"""
+        if 'file_path' in logo.metadata and os.path.exists(logo.metadata['file_path']):
+            # Read and decode once up front: the handle is closed right away and the
+            # decoded pixels are shared by extraction, variations, upscaling and exports
+            with open(logo.metadata['file_path'], 'rb') as f:
+                image = Image.open(io.BytesIO(f.read()))
+                image.load()
+                return image
+        
+        # Convert from data URL if no file path
+        try:
+            if logo.url.startswith('data:image'):
+                img_data = logo.url.split(',')[1]
+                img_bytes = base64.b64decode(img_data)
+                image = Image.open(io.BytesIO(img_bytes))
+                image.load()
+                return image
+        except Exception:
+            logger.warning(f"Could not load image for logo {logo.id}")
+        return None
+    
+    def _apply_logo_enhancement(self, logo: LogoResult, original_image: Image.Image, upscaled_logo: Image.Image):
+        """Extract colors, build variations and exports, and update the logo in place"""
+        # 1. Extract colors from the logo
+        extracted_colors = self._extract_colors_from_logo(original_image)
+        
+        # 2. Generate color variations
+        color_variations = self._generate_color_variations(original_image)
+        
+        # 3. Save upscaled version; without an upscaler _upscale_logos hands back the
+        # original image, so reuse its file and URL instead of writing a duplicate
+        upscaled = upscaled_logo is not original_image
+        if upscaled:
+            upscaled_path = os.path.join(self.logos_dir, f"{logo.id}_upscaled.png")
+            logo.url = self._save_png_data_url(upscaled_logo, upscaled_path)  # Use upscaled version as main
+        else:
+            upscaled_path = logo.metadata.get('file_path')
+        
+        # 4. Create social media exports
+        social_exports = self._create_social_media_exports(upscaled_logo, logo.id)
+        
+        # 5. Save color variations
+        variation_paths = []
+        for j, variation in enumerate(color_variations):
+            variation_path = os.path.join(self.variations_dir, f"{logo.id}_variation_{j}.png")
+            variation_paths.append({
+                'path': variation_path,
+                'url': self._save_png_data_url(variation, variation_path)
+            })
+        
+        # Update the logo in place with all new features; LogoResult does
+        # not validate on assignment, so this avoids re-copying and re-validating
+        logo.style_confidence = min(logo.style_confidence + 0.1, 1.0)
+        logo.quality_score = min(logo.quality_score + 0.15, 1.0)
+        enhancement_features = ["color_extraction", "color_variations", "social_media_exports"]
+        if upscaled:
+            enhancement_features.insert(0, "4x_upscaling")
+        logo.metadata.update({
+            "enhanced": True,
+            "upscaled": upscaled,
+            "upscaled_path": upscaled_path,
+            "original_size": original_image.size,
+            "upscaled_size": upscaled_logo.size,
+            "extracted_colors": extracted_colors,
+            "color_variations": variation_paths,
+            "social_exports": social_exports,
+            "enhancement_features": enhancement_features
+        })
+    
+    def _response_cache_path(self, request: BrandRequest) -> str:
+        """Path of the cached response for a request, keyed by its canonical JSON"""
+        key = hashlib.blake2b(request.model_dump_json().encode(), digest_size=16).hexdigest()
+        return os.path.join(self.response_cache_dir, f"{key}.json")
+    
+    async def get_cached_response(self, request: BrandRequest) -> Optional[BrandResponse]:
+        """Return the response of an identical earlier request, if still fresh, under a new job id"""
+        if self.settings.response_cache_ttl_seconds <= 0:
+            return None
+        
+        # Multi-MB read and parse; keep it off the event loop
+        cached = await asyncio.to_thread(self._read_cached_response, request)
+        if cached is None:
+            return None
+        
+        # The original job is long gone; track the hit as its own completed job
+        # so /status and /result work for the job_id the client receives. The
+        # cache entry itself serves as the stored result
+        job_id = str(uuid.uuid4())
+        response = cached.model_copy(update={"job_id": job_id})
+        self._track_job(job_id, {
+            "status": "completed",
+            "progress": 1.0,
+            "current_step": "Completed",
+            "result_path": self._response_cache_path(request)
+        })
+        self._expire_job_later(job_id)
+        return response
+    
+    def _read_cached_response(self, request: BrandRequest) -> Optional[BrandResponse]:
+        """Load and parse a fresh cache entry, deleting it if it has expired"""
+        cache_path = self._response_cache_path(request)
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.settings.response_cache_ttl_seconds:
+                os.unlink(cache_path)
+                return None
+            with open(cache_path, 'rb') as f:
+                return BrandResponse.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    async def cache_response(self, request: BrandRequest, response: BrandResponse) -> None:
+        """Persist a serialized response so identical requests can skip generation"""
+        if self.settings.response_cache_ttl_seconds <= 0:
+            return
+        
+        # Placeholder logos mean SD was unavailable or failed; caching them would
+        # keep serving placeholders long after the failure cleared
+        if not response.logos or any(
+            logo.metadata.get("generated_with") != "stable_diffusion" for logo in response.logos
+        ):
+            return
+        
+        # Serializing and writing several MB, and the occasional prune, run off the event loop
+        prune = time.time() - self._response_cache_pruned_at > _RESPONSE_CACHE_PRUNE_INTERVAL
+        if prune:
+            self._response_cache_pruned_at = time.time()
+        await asyncio.to_thread(self._write_cached_response, request, response, prune)
+    
+    def _write_cached_response(self, request: BrandRequest, response: BrandResponse, prune: bool):
+        """Atomically write one cache entry, then prune expired ones if due"""
+        cache_path = self._response_cache_path(request)
+        try:
+            tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+            _write_bytes(tmp_path, response.model_dump_json().encode())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache brand response: {e}")
+        
+        if prune:
+            self._prune_response_cache()
+    
+    def _prune_response_cache(self):
+        """Delete cached responses (and leftover temp files) older than response_cache_ttl_seconds"""
+        cutoff = time.time() - self.settings.response_cache_ttl_seconds
+        try:
+            with os.scandir(self.response_cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError as e:
+            logger.warning(f"Could not prune response cache: {e}")
+    
+    def _track_job(self, job_id: str, job: Dict):
+        """Store job state, evicting the oldest jobs beyond max_tracked_jobs"""
+        self.active_jobs[job_id] = job
+        self.active_jobs.move_to_end(job_id)
+        while len(self.active_jobs) > self.settings.max_tracked_jobs:
+            self._drop_job(next(iter(self.active_jobs)))
+        self._publish_job_status(job_id)
+    
+    def _drop_job(self, job_id: str):
+        """Forget a job, deleting its stored result if it owns one"""
+        self.active_jobs.pop(job_id, None)
+        try:
+            os.unlink(self._job_result_path(job_id))
+        except OSError:
+            pass
+    
+    def _expire_job_later(self, job_id: str):
+        """Drop a finished job's state once job_retention_seconds have passed"""
+        asyncio.get_running_loop().call_later(
+            self.settings.job_retention_seconds, self._drop_job, job_id
+        )
+    
+    def _job_result_path(self, job_id: str) -> str:
+        """Path of the file holding a finished job's serialized response"""
+        return os.path.join(self.job_results_dir, f"{job_id}.json")
+    
+    def _clear_job_results(self):
+        """Delete every stored job result"""
+        try:
+            with os.scandir(self.job_results_dir) as entries:
+                for entry in entries:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError as e:
+            logger.warning(f"Could not clear job results: {e}")
+    
+    async def get_job_result(self, job_id: str) -> Optional[BrandResponse]:
+        """Load a finished job's response from its stored file, or None if it is gone"""
+        job = self.active_jobs.get(job_id)
+        if not job or "result_path" not in job:
+            return None
+        
+        def load() -> Optional[BrandResponse]:
+            try:
+                with open(job["result_path"], 'rb') as f:
+                    return BrandResponse.model_validate_json(f.read())
+            except (OSError, ValueError):
+                return None
+        
+        result = await asyncio.to_thread(load)
+        # Cache hits share the entry of the request they replay
+        return result.model_copy(update={"job_id": job_id}) if result is not None else None
+    
     def _update_job_progress(self, job_id: str, progress: float, step: str):
         """Update job progress for status tracking"""
         if job_id in self.active_jobs:
@@ -1033,11 +1678,56 @@ The brand embodies a {request.style} aesthetic with {request.color_scheme} tones
                 "progress": progress,
                 "current_step": step
             })
+            self._publish_job_status(job_id)
+    
+    def _job_status_event(self, job_id: str, job: Dict) -> Dict:
+        """Client-facing snapshot of a job, shaped like BrandGenerationStatus"""
+        return {
+            "job_id": job_id,
+            "status": job.get("status", "unknown"),
+            "progress": job.get("progress", 0.0),
+            "current_step": job.get("current_step"),
+            "error_message": job.get("error")
+        }
+    
+    def _publish_job_status(self, job_id: str):
+        """Push the job's current status to every open stream for it"""
+        watchers = self._job_watchers.get(job_id)
+        if not watchers:
+            return
+        event = self._job_status_event(job_id, self.active_jobs[job_id])
+        for queue in watchers:
+            queue.put_nowait(event)
     
     async def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get the status of a brand generation job"""
         return self.active_jobs.get(job_id)
     
+    async def stream_job_status(self, job_id: str) -> AsyncIterator[Dict]:
+        """Yield a job's status on every change until it completes or fails"""
+        job = self.active_jobs.get(job_id)
+        if job is None:
+            return
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        self._job_watchers.setdefault(job_id, []).append(queue)
+        try:
+            event = self._job_status_event(job_id, job)
+            while True:
+                yield event
+                if event["status"] in ("completed", "failed"):
+                    return
+                # Evicted jobs never publish again, so don't wait on them forever
+                event = await asyncio.wait_for(queue.get(), self.settings.job_timeout_seconds)
+        except asyncio.TimeoutError:
+            return
+        finally:
+            watchers = self._job_watchers.get(job_id, [])
+            if queue in watchers:
+                watchers.remove(queue)
+            if not watchers:
+                self._job_watchers.pop(job_id, None)
+    
     async def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up Brand Service...")
@@ -1046,7 +1736,12 @@ The brand embodies a {request.style} aesthetic with {request.color_scheme} tones
             if self.neo4j_driver:
                 await self.neo4j_driver.close()
             
+            self._export_pool.shutdown(wait=False)
+            
             # Cleanup AI models if needed
+            if self.deepcache_helper:
+                self.deepcache_helper.disable()
+                self.deepcache_helper = None
             
             logger.info("Brand Service cleanup completed")
             
@@ -10,6 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
 import sys
+from contextlib import asynccontextmanager
 
 # Add the project root to the Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -17,11 +18,18 @@ sys.path.insert(0, project_root)
 
 from api.main import app as api_app
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the mounted API's lifespan, which Starlette skips for sub-apps"""
+    async with api_app.router.lifespan_context(api_app):
+        yield
+
 # Create the main app
 app = FastAPI(
     title="Brand Creator Full Stack",
     description="AI-powered brand creation platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount the API
@@ -71,10 +79,15 @@ if __name__ == "__main__":
     print(f"API docs: http://localhost:{port}/docs")
     print(f"Health check: http://localhost:{port}/api/health")
     
+    # Each worker loads its own copy of the models and batches only its own
+    # requests, so keep WORKERS at 1 when serving Stable Diffusion
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1")),
         reload=False,
         log_level="info"
     )